@@ -1,5 +1,9 @@
 """Application settings and color scheme."""
 
+import os
+import sys
+from types import MappingProxyType
+
 COLORS = {
     "primary": "#6f2fa6",
     "primary_text": "#b065d6",
@@ -17,6 +21,9 @@ COLORS = {
     "error": "#ff6b7a",
 }
 
+# Read-only view returned by get_colors(), matching the accessibility palettes
+_COLORS_VIEW = MappingProxyType(COLORS)
+
 
 def get_colors():
     """Get effective colors, using AccessibilityManager overrides if available."""
@@ -27,7 +34,7 @@ def get_colors():
             return manager.get_effective_colors()
     except Exception:
         pass
-    return COLORS
+    return _COLORS_VIEW
 
 
 APP_SETTINGS = {
@@ -37,3 +44,16 @@ APP_SETTINGS = {
     "touch_target_min": 44,
     "focus_outline_width": 3,
 }
+
+
+def get_data_path(*parts: str) -> str:
+    """Get the path to a bundled file under data/.
+
+    Uses the PyInstaller unpack directory in a frozen build, like the
+    asset path helpers, and the source root otherwise.
+    """
+    if getattr(sys, "frozen", False):
+        base = sys._MEIPASS
+    else:
+        base = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base, "data", *parts)
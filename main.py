@@ -82,6 +82,10 @@ def main():
     window.raise_()
     window.activateWindow()
 
+    # Preload the speech-to-text model so the first dictation is instant
+    from stt.engine import warm_up_in_background
+    warm_up_in_background()
+
     sys.exit(app.exec())
 
 
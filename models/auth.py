@@ -12,12 +12,17 @@ from models.audit import AuditLog
 class AuthManager:
     """Handle user authentication with role enforcement."""
 
+    # bcrypt work factor (log2 of the key-expansion rounds).  Tests lower
+    # this on their own instance; hashes record their cost, so verifying
+    # stays correct whatever value produced them.
+    _bcrypt_rounds = 12
+
     def __init__(self, db_manager: DatabaseManager):
         self.db = db_manager
         self.current_user: User = None
 
     def hash_password(self, password: str) -> str:
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=self._bcrypt_rounds)
         return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
     def verify_password(self, password: str, hashed: str) -> bool:
@@ -5,6 +5,7 @@ from pathlib import Path
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 Base = declarative_base()
 
@@ -23,14 +24,26 @@ class DatabaseManager:
     """Database connection and session management."""
 
     def __init__(self, db_path: str = None):
-        if db_path is None:
-            data_dir = get_data_directory()
-            self.db_path = data_dir / "accesstwin.db"
+        if db_path == ":memory:":
+            # In-memory database (used by tests).  Every connection to
+            # ":memory:" opens a fresh empty database, so all sessions share
+            # one connection, which may be used from any thread.
+            self.db_path = None
+            self.engine = create_engine(
+                "sqlite:///:memory:",
+                echo=False,
+                connect_args={"check_same_thread": False},
+                poolclass=StaticPool,
+            )
         else:
-            self.db_path = Path(db_path)
-            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            if db_path is None:
+                data_dir = get_data_directory()
+                self.db_path = data_dir / "accesstwin.db"
+            else:
+                self.db_path = Path(db_path)
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        self.engine = create_engine(f"sqlite:///{self.db_path}", echo=False)
+            self.engine = create_engine(f"sqlite:///{self.db_path}", echo=False)
 
         # Import all models so metadata is populated before create_all
         from models.user import User  # noqa: F401
@@ -0,0 +1,46 @@
+"""Preallocated mono float32 buffer for microphone capture."""
+
+import numpy as np
+
+
+class AudioBuffer:
+    """Growable sample buffer written at a running offset.
+
+    Each captured block is copied once into a preallocated array, so the
+    recording never has to be re-concatenated, and ``view()`` hands the
+    captured samples to the transcriber without copying.  Capacity doubles
+    when full.
+    """
+
+    def __init__(self, sample_rate: int, seconds: float = 60.0):
+        self._data = np.empty(int(sample_rate * seconds), dtype=np.float32)
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return self._pos
+
+    def append(self, block: np.ndarray):
+        """Append a ``(frames, 1)`` or ``(frames,)`` float32 block of samples.
+
+        The block is copied straight from sounddevice's read buffer into
+        place; ``casting="no"`` rejects any input that would need a
+        converted temporary first.
+        """
+        samples = block[:, 0] if block.ndim == 2 else block
+        end = self._pos + samples.shape[0]
+        if end > self._data.shape[0]:
+            self._grow(end)
+        np.copyto(self._data[self._pos:end], samples, casting="no")
+        self._pos = end
+
+    def view(self, start: int = 0, stop: int = None) -> np.ndarray:
+        """Return captured samples ``[start:stop]`` as a view (no copy)."""
+        if stop is None or stop > self._pos:
+            stop = self._pos
+        return self._data[start:stop]
+
+    def _grow(self, needed: int):
+        capacity = max(needed, 2 * self._data.shape[0])
+        data = np.empty(capacity, dtype=np.float32)
+        data[:self._pos] = self._data[:self._pos]
+        self._data = data
@@ -0,0 +1,42 @@
+"""Audio preprocessing applied to recordings before transcription."""
+
+import numpy as np
+
+# Samples quieter than this (about -40 dBFS) count as silence.
+SILENCE_THRESHOLD = 0.01
+# Audio kept either side of the detected speech so word onsets and
+# trailing consonants are not clipped.
+PAD_SECONDS = 0.25
+
+
+def prepare_audio(audio: np.ndarray, sample_rate: int = 16000,
+                  threshold: float = SILENCE_THRESHOLD) -> np.ndarray:
+    """Downmix to mono and trim leading/trailing silence.
+
+    Returns a view into *audio* when it is already mono, so the trim costs
+    no copy.  A recording with no sample above *threshold* is returned
+    untrimmed and left for Whisper to judge.
+    """
+    if audio.ndim == 2:
+        if audio.shape[1] == 1:
+            audio = audio[:, 0]
+        else:
+            audio = audio.mean(axis=1, dtype=np.float32)
+
+    loud = np.abs(audio) > threshold
+    first = int(loud.argmax())
+    if not loud[first]:
+        return audio
+    last = audio.shape[0] - int(loud[::-1].argmax())
+
+    pad = int(sample_rate * PAD_SECONDS)
+    return audio[max(first - pad, 0):last + pad]
+
+
+def is_silent(audio: np.ndarray, threshold: float = SILENCE_THRESHOLD) -> bool:
+    """Return True when the RMS level of *audio* is below *threshold*."""
+    if not audio.shape[0]:
+        return True
+    # dot() sums the squares without allocating a squared copy
+    energy = float(np.dot(audio, audio)) / audio.shape[0]
+    return energy < threshold * threshold
@@ -1,6 +1,8 @@
 """STT Engine — thread-safe singleton managing the faster-whisper model."""
 
+import functools
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
@@ -9,9 +11,33 @@ from stt.stt_settings_store import load_stt_settings
 
 _DOWNLOAD_ROOT = Path.home() / ".accesstwin" / "whisper_models"
 
+# Recordings longer than one Whisper window (30 s) are split into chunks
+# and decoded together through BatchedInferencePipeline when available.
+_BATCH_MIN_SAMPLES = 30 * 16000
+_BATCH_SIZE = 8
 
+
+def _cuda_available() -> bool:
+    """Check whether CTranslate2 can see a CUDA device."""
+    try:
+        import ctranslate2
+        return ctranslate2.get_cuda_device_count() > 0
+    except Exception:
+        return False
+
+
+def _resolve_device(device: str, compute_type: str) -> tuple:
+    """Turn "auto" settings into a concrete (device, compute_type) pair."""
+    if device == "auto":
+        device = "cuda" if _cuda_available() else "cpu"
+    if compute_type == "auto":
+        compute_type = "int8_float16" if device == "cuda" else "int8"
+    return device, compute_type
+
+
+@functools.lru_cache(maxsize=1)
 def is_available() -> bool:
-    """Check if faster-whisper is installed."""
+    """Check if faster-whisper is installed (probed once per process)."""
     try:
         import faster_whisper  # noqa: F401
         return True
@@ -24,6 +50,8 @@ class STTEngine:
 
     _instance = None
     _lock = threading.Lock()
+    # Single worker so transcriptions never run concurrently on the model
+    _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stt")
 
     def __new__(cls):
         with cls._lock:
@@ -31,13 +59,23 @@ class STTEngine:
                 cls._instance = super().__new__(cls)
                 cls._instance._model = None
                 cls._instance._loaded_size = None
+                cls._instance._settings = None
+                cls._instance._batched = None
             return cls._instance
 
     @staticmethod
     def is_model_cached(model_size: str) -> bool:
-        """Check if model files exist locally."""
-        model_dir = _DOWNLOAD_ROOT / f"models--Systran--faster-whisper-{model_size}"
-        return model_dir.exists() and any(model_dir.rglob("model.bin"))
+        """Check if model files exist locally.
+
+        Looks only at ``snapshots/<revision>/model.bin`` in the Hugging Face
+        cache layout instead of walking the whole model directory.
+        """
+        snapshots = (_DOWNLOAD_ROOT / f"models--Systran--faster-whisper-{model_size}"
+                     / "snapshots")
+        try:
+            return any((rev / "model.bin").is_file() for rev in snapshots.iterdir())
+        except OSError:
+            return False
 
     def load_model(self):
         """Load or reload the whisper model based on current settings."""
@@ -45,19 +83,37 @@ class STTEngine:
 
         settings = load_stt_settings()
         size = settings["model_size"]
-        device = settings["device"]
-        compute_type = settings["compute_type"]
+        device, compute_type = _resolve_device(
+            settings["device"], settings["compute_type"])
 
         with self._lock:
+            # Cache settings for transcribe(); refreshed on every load_model()
+            self._settings = settings
             if self._model is not None and self._loaded_size == size:
                 return
             _DOWNLOAD_ROOT.mkdir(parents=True, exist_ok=True)
-            self._model = WhisperModel(
-                size,
-                device=device,
-                compute_type=compute_type,
-                download_root=str(_DOWNLOAD_ROOT),
-            )
+            try:
+                model = WhisperModel(
+                    size,
+                    device=device,
+                    compute_type=compute_type,
+                    download_root=str(_DOWNLOAD_ROOT),
+                )
+            except Exception:
+                # A visible GPU can still lack the cuBLAS/cuDNN libraries;
+                # when the device was auto-selected, fall back to the CPU.
+                if device != "cuda" or settings["device"] != "auto":
+                    raise
+                device, compute_type = _resolve_device(
+                    "cpu", settings["compute_type"])
+                model = WhisperModel(
+                    size,
+                    device=device,
+                    compute_type=compute_type,
+                    download_root=str(_DOWNLOAD_ROOT),
+                )
+            self._model = model
+            self._batched = _make_batched_pipeline(model)
             self._loaded_size = size
 
     def transcribe(self, audio_array) -> str:
@@ -65,29 +121,116 @@ class STTEngine:
 
         Returns the transcribed text string.
         """
+        return " ".join(self.transcribe_stream(audio_array)).strip()
+
+    def transcribe_async(self, audio_array) -> Future:
+        """Run transcribe() on the engine's background thread.
+
+        Returns a Future resolving to the transcribed text, so the caller's
+        thread (e.g. the Qt main thread) is not blocked while decoding.
+        """
+        return self._executor.submit(self.transcribe, audio_array)
+
+    def transcribe_stream(self, audio_array):
+        """Yield the text of each segment as soon as it is decoded.
+
+        faster-whisper decodes lazily, so callers can show partial text
+        before the whole recording has been transcribed.
+        """
         with self._lock:
             if self._model is None:
                 raise RuntimeError("Model not loaded. Call load_model() first.")
             model = self._model
+            batched = self._batched
+            settings = self._settings
 
         # The MacBook Pro mic can produce values outside [-1, 1] when
         # recording at 16kHz (native rate is 48kHz).  Whisper expects
-        # audio in [-1, 1], so we must normalise first.
-        peak = float(np.max(np.abs(audio_array)))
-        if peak > 1.0:
-            audio_array = (audio_array / peak).astype(np.float32)
-
-        settings = load_stt_settings()
-        segments, _ = model.transcribe(
-            audio_array,
-            language=settings["language"],
-            beam_size=5,
-            condition_on_previous_text=False,
-        )
-        return " ".join(seg.text.strip() for seg in segments).strip()
+        # audio in [-1, 1], so we must normalise first.  min/max avoids an
+        # abs() copy; the caller's buffer is never modified in place.
+        # Setting "normalize_audio" to false skips the scan entirely for
+        # input devices known to deliver in-range audio.
+        if settings["normalize_audio"]:
+            peak = max(-float(audio_array.min()), float(audio_array.max()))
+            if peak > 1.0:
+                audio_array = np.multiply(
+                    audio_array, np.float32(1.0 / peak), dtype=np.float32,
+                )
+
+        if batched is not None and audio_array.shape[0] > _BATCH_MIN_SAMPLES:
+            segments, _ = batched.transcribe(
+                audio_array,
+                language=settings["language"],
+                beam_size=5,
+                batch_size=_BATCH_SIZE,
+            )
+        else:
+            segments, _ = model.transcribe(
+                audio_array,
+                language=settings["language"],
+                beam_size=5,
+                condition_on_previous_text=False,
+            )
+        for seg in segments:
+            text = seg.text.strip()
+            if text:
+                yield text
 
     def unload(self):
         """Release the model from memory."""
         with self._lock:
             self._model = None
+            self._batched = None
             self._loaded_size = None
+
+
+def _make_batched_pipeline(model):
+    """Wrap *model* for batched decoding (faster-whisper 1.1+), else None."""
+    try:
+        from faster_whisper import BatchedInferencePipeline
+    except ImportError:
+        return None
+    return BatchedInferencePipeline(model=model)
+
+
+_ENGINE = None
+_ENGINE_LOCK = threading.Lock()
+
+
+def get_engine() -> STTEngine:
+    """Return the process-wide STTEngine, creating it on first use.
+
+    Workers share this instance so live dictation and one-off
+    transcription never hold two copies of the model.
+    """
+    global _ENGINE
+    if _ENGINE is None:
+        with _ENGINE_LOCK:
+            if _ENGINE is None:
+                _ENGINE = STTEngine()
+    return _ENGINE
+
+
+def warm_up_in_background():
+    """Load an already-downloaded model on a daemon thread.
+
+    Called at app launch so the first dictation does not stall while
+    CTranslate2 loads weights.  Never triggers a download.
+    """
+    if not is_available():
+        return
+    if not STTEngine.is_model_cached(load_stt_settings()["model_size"]):
+        return
+    threading.Thread(target=_warm_up, name="stt-warmup", daemon=True).start()
+
+
+def _warm_up():
+    try:
+        engine = get_engine()
+        engine.load_model()
+        # One second of silence primes the decoder's kernels.  It goes through
+        # the engine's single worker, so it never decodes alongside a
+        # dictation started during warm-up.
+        engine.transcribe_async(np.zeros(16000, dtype=np.float32)).result()
+    except Exception:
+        pass
@@ -9,8 +9,11 @@ _SETTINGS_FILE = _SETTINGS_DIR / "stt_settings.json"
 _DEFAULTS = {
     "model_size": "small",
     "language": "en",
-    "compute_type": "int8",
-    "device": "cpu",
+    # "auto" picks CUDA with int8_float16 when a GPU is available, else
+    # CPU with int8.  Either may be set explicitly.
+    "compute_type": "auto",
+    "device": "auto",
+    "normalize_audio": True,
 }
 
 
@@ -1,9 +1,33 @@
 """QThread workers for STT recording, transcription, and model download."""
 
 import numpy as np
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
 
-from stt.engine import STTEngine
+from stt.audio_buffer import AudioBuffer
+from stt.audio_kernels import is_silent, prepare_audio
+from stt.engine import get_engine
+
+# Imported once at module load: sounddevice pulls in cffi and the PortAudio
+# library, which would otherwise be paid on every recording start.
+# OSError covers a sounddevice install whose PortAudio library is missing.
+try:
+    import sounddevice as sd
+except (ImportError, OSError):
+    sd = None
+
+_SOUNDDEVICE_MISSING = (
+    "The 'sounddevice' package is not installed.\n"
+    "Install it with: pip install sounddevice"
+)
+
+# Frames per PortAudio read.  A power of two (64 ms at 16kHz) maps onto the
+# host API's native buffer sizes, unlike a 100 ms read of 1600 frames.
+BLOCK_SIZE = 1024
+
+
+def _join_text(committed: str, new: str) -> str:
+    """Append freshly transcribed text to already-committed text."""
+    return " ".join(part for part in (committed, new.strip()) if part)
 
 
 class AudioRecordWorker(QThread):
@@ -23,40 +47,41 @@ class AudioRecordWorker(QThread):
         self._running = False
 
     def run(self):
-        try:
-            import sounddevice as sd
-        except ImportError:
-            self.error_signal.emit(
-                "The 'sounddevice' package is not installed.\n"
-                "Install it with: pip install sounddevice"
-            )
+        if sd is None:
+            self.error_signal.emit(_SOUNDDEVICE_MISSING)
             return
 
         sample_rate = 16000
         channels = 1
-        chunks: list[np.ndarray] = []
+        buffer = AudioBuffer(sample_rate)
         self._running = True
 
         try:
             with sd.InputStream(samplerate=sample_rate, channels=channels,
-                                dtype="float32") as stream:
+                                dtype="float32", blocksize=BLOCK_SIZE,
+                                latency="high") as stream:
                 while self._running:
-                    data, _ = stream.read(int(sample_rate * 0.1))  # 100ms chunks
-                    chunks.append(data.copy())
+                    data, _ = stream.read(BLOCK_SIZE)
+                    buffer.append(data)
         except Exception as e:
             self.error_signal.emit(f"Microphone error: {e}")
             return
 
-        if not chunks:
+        if not len(buffer):
             self.error_signal.emit("No audio was recorded.")
             return
 
-        audio = np.concatenate(chunks, axis=0).flatten()
-        self.finished_signal.emit(audio)
+        self.finished_signal.emit(prepare_audio(buffer.view(), sample_rate))
+
 
+class TranscribeWorker(QObject):
+    """Transcribes an audio array on the engine's persistent worker thread.
 
-class TranscribeWorker(QThread):
-    """Runs STTEngine.transcribe() on an audio array in a background thread."""
+    Keeps the QThread-style ``start()`` and signals, but instead of spawning
+    a thread per recording it queues the job on STTEngine's long-lived
+    executor.  Signals are emitted from that thread and delivered to
+    receivers in the GUI thread via queued connections.
+    """
 
     transcription_ready = pyqtSignal(str)
     finished_signal = pyqtSignal()
@@ -66,11 +91,16 @@ class TranscribeWorker(QThread):
         super().__init__(parent)
         self._audio = audio_array
 
-    def run(self):
+    def start(self):
+        # Hand the recording to the engine and drop our reference, so its
+        # buffer is freed as soon as the transcription finishes.
+        audio, self._audio = self._audio, None
+        future = get_engine().transcribe_async(audio)
+        future.add_done_callback(self._on_done)
+
+    def _on_done(self, future):
         try:
-            engine = STTEngine()
-            text = engine.transcribe(self._audio)
-            self.transcription_ready.emit(text)
+            self.transcription_ready.emit(future.result())
         except Exception as e:
             self.error_signal.emit(f"Transcription error: {e}")
         finally:
@@ -88,7 +118,7 @@ class ModelDownloadWorker(QThread):
 
     def run(self):
         try:
-            engine = STTEngine()
+            engine = get_engine()
             engine.load_model()
         except Exception as e:
             self.error_signal.emit(f"Model download failed: {e}")
@@ -100,7 +130,10 @@ class LiveDictationWorker(QThread):
     """Records audio via blocking reads and transcribes periodically.
 
     Uses the same proven blocking-read approach as AudioRecordWorker,
-    with periodic transcription of all accumulated audio for live updates.
+    with periodic transcription of a sliding window of recent audio for
+    live updates.  Audio that falls out of the window is transcribed once
+    and kept as committed text, so each update costs O(window) rather than
+    re-transcribing the whole session.
     """
 
     partial_text = pyqtSignal(str)
@@ -108,10 +141,15 @@ class LiveDictationWorker(QThread):
     finished_signal = pyqtSignal()
 
     SAMPLE_RATE = 16000
-    # Transcribe every N chunks. Each chunk is 100ms, so 30 = every 3 seconds.
-    TRANSCRIBE_EVERY = 30
-    # Minimum chunks before first transcription (2 seconds).
-    MIN_CHUNKS = 20
+    # All intervals below are in samples, independent of the read block size.
+    # Transcribe roughly every 3 seconds of captured audio.
+    TRANSCRIBE_EVERY = 3 * SAMPLE_RATE
+    # Minimum audio before first transcription (2 seconds).
+    MIN_SAMPLES = 2 * SAMPLE_RATE
+    # Longest stretch of audio re-transcribed per update (30 seconds).
+    WINDOW_SAMPLES = 30 * SAMPLE_RATE
+    # Audio past the window is committed in whole steps of this (10 seconds).
+    COMMIT_SAMPLES = 10 * SAMPLE_RATE
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -120,51 +158,122 @@ class LiveDictationWorker(QThread):
     def stop_recording(self):
         self._running = False
 
-    def run(self):
+    def _submit_span(self, engine, buffer, start, end):
+        """Queue ``buffer[start:end]`` in slices of at most WINDOW_SAMPLES."""
+        return [
+            engine.transcribe_async(
+                buffer.view(pos, min(pos + self.WINDOW_SAMPLES, end)))
+            for pos in range(start, end, self.WINDOW_SAMPLES)
+        ]
+
+    def _submit_update(self, engine, buffer, window_start):
+        """Queue transcription of the pending window on the engine thread.
+
+        Everything older than the newest WINDOW_SAMPLES, rounded up to whole
+        COMMIT_SAMPLES, is transcribed separately so it can be committed.
+        The window stays within WINDOW_SAMPLES however many ticks were
+        skipped while a previous update was still decoding.
+        """
+        commit_end = window_start
+        excess = len(buffer) - window_start - self.WINDOW_SAMPLES
+        if excess > 0:
+            commit_end += -(-excess // self.COMMIT_SAMPLES) * self.COMMIT_SAMPLES
+        commit_futures = self._submit_span(engine, buffer, window_start, commit_end)
+        window_future = engine.transcribe_async(buffer.view(commit_end))
+        return commit_end, commit_futures, window_future
+
+    def _apply_update(self, update, window_start, committed_text):
+        """Fold a finished update into the committed text and emit it.
+
+        Also returns the window's own transcript, or None if it failed.
+        """
+        commit_end, commit_futures, window_future = update
+        window_text = None
         try:
-            import sounddevice as sd
-        except ImportError:
-            self.error_signal.emit(
-                "The 'sounddevice' package is not installed.\n"
-                "Install it with: pip install sounddevice"
-            )
+            if commit_futures:
+                for text in [future.result() for future in commit_futures]:
+                    committed_text = _join_text(committed_text, text)
+                window_start = commit_end
+            window_text = window_future.result()
+            text = _join_text(committed_text, window_text)
+            if text:
+                self.partial_text.emit(text)
+        except Exception:
+            pass
+        return window_start, committed_text, window_text
+
+    def run(self):
+        if sd is None:
+            self.error_signal.emit(_SOUNDDEVICE_MISSING)
             return
 
         self._running = True
-        chunks: list[np.ndarray] = []
-        engine = STTEngine()
-        chunk_counter = 0
+        buffer = AudioBuffer(self.SAMPLE_RATE)
+        window_start = 0  # first sample not yet folded into committed_text
+        committed_text = ""
+        # Transcript of buffer[window_start:submitted_end], None if unknown
+        window_text = ""
+        engine = get_engine()
+        next_tick = self.TRANSCRIBE_EVERY  # sample count of the next update
+        submitted_end = 0  # buffer length when the last update was queued
+        update = None  # in-flight (commit_end, commit_futures, window_future)
 
         try:
+            # PortAudio's blocking-read ring buffer is filled from its own C
+            # thread; "high" latency gives it headroom, and transcription runs
+            # on the engine's worker thread so this loop keeps draining it.
             with sd.InputStream(samplerate=self.SAMPLE_RATE, channels=1,
-                                dtype="float32") as stream:
+                                dtype="float32", blocksize=BLOCK_SIZE,
+                                latency="high") as stream:
                 while self._running:
-                    data, _ = stream.read(int(self.SAMPLE_RATE * 0.1))
-                    chunks.append(data.copy())
-                    chunk_counter += 1
-
-                    if (chunk_counter % self.TRANSCRIBE_EVERY == 0
-                            and len(chunks) >= self.MIN_CHUNKS):
-                        audio = np.concatenate(chunks, axis=0).flatten()
-                        try:
-                            text = engine.transcribe(audio)
-                            if text.strip():
-                                self.partial_text.emit(text.strip())
-                        except Exception:
-                            pass
+                    data, _ = stream.read(BLOCK_SIZE)
+                    buffer.append(data)
+
+                    if update is not None and update[2].done():
+                        window_start, committed_text, window_text = (
+                            self._apply_update(update, window_start, committed_text))
+                        update = None
+
+                    if len(buffer) < next_tick:
+                        continue
+                    next_tick += self.TRANSCRIBE_EVERY
+                    if update is not None:
+                        continue
+                    # Skip the update while the user is silent: audio since
+                    # the last update adds nothing for Whisper to transcribe.
+                    # The last window's text is committed and the window
+                    # moves past the pause, so it is never transcribed.
+                    if is_silent(buffer.view(submitted_end)):
+                        if window_text is not None:
+                            committed_text = _join_text(committed_text, window_text)
+                            window_text = ""
+                            window_start = submitted_end = len(buffer)
+                        continue
+                    if len(buffer) - window_start >= self.MIN_SAMPLES:
+                        update = self._submit_update(engine, buffer, window_start)
+                        submitted_end = len(buffer)
         except Exception as e:
             self.error_signal.emit(f"Microphone error: {e}")
             self.finished_signal.emit()
             return
 
-        # Final transcription with all captured audio.
-        if chunks:
-            audio = np.concatenate(chunks, axis=0).flatten()
+        if update is not None:
+            window_start, committed_text, _ = self._apply_update(
+                update, window_start, committed_text)
+
+        # Final transcription of the remaining window after the committed
+        # text, in slices of at most WINDOW_SAMPLES.
+        if len(buffer) > window_start:
+            futures = self._submit_span(engine, buffer, window_start, len(buffer))
             try:
-                text = engine.transcribe(audio)
-                if text.strip():
-                    self.partial_text.emit(text.strip())
+                text = committed_text
+                for part in [future.result() for future in futures]:
+                    text = _join_text(text, part)
+                if text:
+                    self.partial_text.emit(text)
             except Exception as e:
                 self.error_signal.emit(f"Transcription error: {e}")
+        elif committed_text:
+            self.partial_text.emit(committed_text)
 
         self.finished_signal.emit()
@@ -1,7 +1,7 @@
 """Shared test fixtures."""
 
-import sys
 import os
+import sys
 
 import pytest
 
@@ -10,15 +10,49 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 
 @pytest.fixture
-def tmp_db(tmp_path):
-    """Return a DatabaseManager backed by a temp file."""
-    db_path = str(tmp_path / "test.db")
+def tmp_db():
+    """Return a DatabaseManager backed by an in-memory SQLite database."""
     from models.database import DatabaseManager
-    return DatabaseManager(db_path=db_path)
+    return DatabaseManager(db_path=":memory:")
 
 
 @pytest.fixture
 def auth_manager(tmp_db):
     """Return an AuthManager using a temp database."""
     from models.auth import AuthManager
-    return AuthManager(tmp_db)
+    manager = AuthManager(tmp_db)
+    # Minimum bcrypt cost: hashing speed is not under test
+    manager._bcrypt_rounds = 4
+    return manager
+
+
+class _FakeSTTEngine:
+    """Stand-in for STTEngine that never loads or downloads a model."""
+
+    def __init__(self):
+        self.calls = []
+
+    def load_model(self):
+        pass
+
+    def transcribe(self, audio_array) -> str:
+        self.calls.append(len(audio_array))
+        return "mock text"
+
+    def transcribe_async(self, audio_array):
+        from concurrent.futures import Future
+        future = Future()
+        try:
+            future.set_result(self.transcribe(audio_array))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+@pytest.fixture
+def fake_stt_engine(monkeypatch):
+    """Patch the STT workers to use a stub engine returning "mock text"."""
+    import stt.workers
+    engine = _FakeSTTEngine()
+    monkeypatch.setattr(stt.workers, "get_engine", lambda: engine)
+    return engine
@@ -25,6 +25,18 @@ class TestColorBlindEngine:
         from ui.color_blind_engine import passes_aaa
         assert passes_aaa("#ffffff", "#000000")
 
+    def test_contrast_batch_matches_scalar(self):
+        from ui.color_blind_engine import (
+            get_safe_palette, validate_contrast, validate_contrast_batch,
+        )
+        fgs = list(get_safe_palette().values())
+        bgs = ["#1a1a2e", "#ffffff", "#0e2d4a"]
+        ratios = validate_contrast_batch(fgs, bgs)
+        assert ratios.shape == (len(fgs), len(bgs))
+        for i, fg in enumerate(fgs):
+            for j, bg in enumerate(bgs):
+                assert ratios[i, j] == pytest.approx(validate_contrast(fg, bg))
+
     def test_wong_palette(self):
         from ui.color_blind_engine import get_safe_palette
         palette = get_safe_palette()
@@ -95,3 +107,39 @@ class TestAccessibilityManager:
         assert mgr2.reading_ruler is True
 
         AccessibilityManager._instance = None
+
+    def test_narrow_signals(self):
+        from ui.accessibility import AccessibilityManager
+        AccessibilityManager._instance = None
+        mgr = AccessibilityManager.create()
+
+        fired = []
+        for name in ("settings_changed", "colors_changed", "fonts_changed"):
+            getattr(mgr, name).connect(lambda name=name: fired.append(name))
+
+        mgr.set_font_scale("large")
+        assert fired == ["fonts_changed", "settings_changed"]
+
+        fired.clear()
+        mgr.load_from_dict({"font_scale": "small", "high_contrast": True})
+        assert sorted(fired) == ["colors_changed", "fonts_changed", "settings_changed"]
+
+        AccessibilityManager._instance = None
+
+    def test_batch_update_emits_once(self):
+        from ui.accessibility import AccessibilityManager
+        AccessibilityManager._instance = None
+        mgr = AccessibilityManager.create()
+
+        fired = []
+        mgr.settings_changed.connect(lambda: fired.append("settings"))
+        mgr.spacing_changed.connect(lambda: fired.append("spacing"))
+
+        with mgr.batch_update():
+            mgr.set_letter_spacing(2)
+            mgr.set_word_spacing(4)
+            mgr.set_line_height(6)
+            assert fired == []
+        assert fired == ["spacing", "settings"]
+
+        AccessibilityManager._instance = None
@@ -0,0 +1,50 @@
+"""Chart helper tests (log grouping and rating parsing)."""
+
+import random
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+
+def _logs(n, seed=7):
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1, 9, 30)
+    logs = []
+    for i in range(n):
+        dt = start + timedelta(minutes=rng.randint(0, 200_000))
+        if i % 3 == 0:
+            dt = dt.replace(tzinfo=timezone.utc)
+        logs.append(SimpleNamespace(created_at=None if i % 40 == 0 else dt))
+    return logs
+
+
+class TestChartUtils:
+    def test_parse_effectiveness_rating(self):
+        from ui.components.chart_utils import parse_effectiveness_rating
+        assert parse_effectiveness_rating("Effectiveness rated: 4/5") == 4.0
+        assert parse_effectiveness_rating("effectiveness rated: 3.5 / 5") == 3.5
+        assert parse_effectiveness_rating("Worked well") is None
+        assert parse_effectiveness_rating("") is None
+
+    def test_group_logs_by_week_vectorised_matches_loop(self, monkeypatch):
+        from ui.components import chart_utils
+        logs = _logs(2000)
+        vectorised = chart_utils.group_logs_by_week(logs)
+        monkeypatch.setattr(chart_utils, "_VECTORIZE_MIN_LOGS", len(logs) + 1)
+        assert chart_utils.group_logs_by_week(logs) == vectorised
+        assert vectorised[0]["label"] == "Jan 01"
+        assert sum(b["value"] for b in vectorised) == sum(
+            1 for log in logs if log.created_at
+        )
+
+    def test_group_logs_by_category_sorted_by_count(self):
+        from ui.components.chart_utils import group_logs_by_category
+        supports = {
+            1: SimpleNamespace(category="sensory"),
+            2: SimpleNamespace(category="motor"),
+        }
+        logs = [SimpleNamespace(support_id=i) for i in (1, 2, 2, 9, 2, 1)]
+        assert group_logs_by_category(logs, supports) == [
+            {"label": "Motor", "value": 3},
+            {"label": "Sensory", "value": 2},
+            {"label": "General", "value": 1},
+        ]
@@ -0,0 +1,154 @@
+"""STT worker and audio preprocessing tests (no model or microphone)."""
+
+import numpy as np
+
+
+class _FakeInputStream:
+    """Blocking-read stream that yields a fixed number of blocks.
+
+    The first *silent* blocks are zeros; the rest are loud.
+    """
+
+    def __init__(self, worker, blocks, on_read=None, silent=0, **kwargs):
+        self._worker = worker
+        self._blocks = blocks
+        self._on_read = on_read
+        self._silent = silent
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def read(self, frames):
+        self._blocks -= 1
+        if self._blocks <= 0:
+            self._worker.stop_recording()
+        if self._on_read is not None:
+            self._on_read(self._blocks)
+        if self._silent > 0:
+            self._silent -= 1
+            return np.zeros((frames, 1), dtype=np.float32), False
+        return np.full((frames, 1), 0.5, dtype=np.float32), False
+
+
+def _fake_sounddevice(worker, blocks, on_read=None, silent=0):
+    class _SD:
+        @staticmethod
+        def InputStream(**kwargs):
+            return _FakeInputStream(worker, blocks, on_read, silent, **kwargs)
+    return _SD
+
+
+class _LaggingEngine:
+    """Engine whose queued transcriptions stay running until finish().
+
+    Waiting on a result finishes them too, as a real decode would.
+    """
+
+    def __init__(self):
+        self.calls = []
+        self._pending = []
+
+    def transcribe(self, audio_array) -> str:
+        self.calls.append(len(audio_array))
+        return "mock text"
+
+    def transcribe_async(self, audio_array):
+        from concurrent.futures import Future
+        engine = self
+
+        class _Future(Future):
+            def result(self, timeout=None):
+                engine.finish()
+                return super().result(timeout)
+
+        self.calls.append(len(audio_array))
+        future = _Future()
+        self._pending.append(future)
+        return future
+
+    def finish(self):
+        for future in self._pending:
+            future.set_result("mock text")
+        self._pending = []
+
+
+class TestAudioKernels:
+    def test_prepare_audio_trims_silence(self):
+        from stt.audio_kernels import prepare_audio
+        audio = np.zeros(48000, dtype=np.float32)
+        audio[20000:21000] = 0.5
+        trimmed = prepare_audio(audio, 16000)
+        assert trimmed.shape[0] == 1000 + 2 * 4000
+        assert np.shares_memory(trimmed, audio)
+
+    def test_prepare_audio_keeps_all_silent_recording(self):
+        from stt.audio_kernels import prepare_audio
+        audio = np.zeros((1600, 1), dtype=np.float32)
+        assert prepare_audio(audio).shape == (1600,)
+
+    def test_is_silent(self):
+        from stt.audio_kernels import is_silent
+        assert is_silent(np.zeros(1600, dtype=np.float32))
+        assert not is_silent(np.full(1600, 0.1, dtype=np.float32))
+
+
+class TestWorkers:
+    def test_transcribe_worker(self, fake_stt_engine):
+        from stt.workers import TranscribeWorker
+        worker = TranscribeWorker(np.zeros(16000, dtype=np.float32))
+        results, done = [], []
+        worker.transcription_ready.connect(results.append)
+        worker.finished_signal.connect(lambda: done.append(True))
+        worker.start()
+        assert results == ["mock text"]
+        assert done == [True]
+
+    def test_live_dictation_worker(self, monkeypatch):
+        import stt.workers
+        from stt.workers import BLOCK_SIZE, LiveDictationWorker
+        worker = LiveDictationWorker()
+        engine = _LaggingEngine()
+        monkeypatch.setattr(stt.workers, "get_engine", lambda: engine)
+
+        # Each decode takes ~15 s of audio to finish, so most 3 s ticks
+        # are skipped while an update is still in flight.
+        lag = 15 * worker.SAMPLE_RATE // BLOCK_SIZE
+
+        def on_read(blocks_left):
+            if blocks_left % lag == 0:
+                engine.finish()
+
+        blocks = 120 * worker.SAMPLE_RATE // BLOCK_SIZE
+        monkeypatch.setattr(stt.workers, "sd",
+                            _fake_sounddevice(worker, blocks, on_read))
+        texts, done = [], []
+        worker.partial_text.connect(texts.append)
+        worker.finished_signal.connect(lambda: done.append(True))
+        worker.run()
+        assert texts and texts[-1].startswith("mock text")
+        assert done == [True]
+        # Every transcription covers at most one window of audio
+        assert len(engine.calls) > 1
+        assert max(engine.calls) <= worker.WINDOW_SAMPLES
+
+    def test_live_dictation_skips_silent_lead_in(self, fake_stt_engine, monkeypatch):
+        import stt.workers
+        from stt.workers import BLOCK_SIZE, LiveDictationWorker
+        worker = LiveDictationWorker()
+        # Two minutes of silence, then 20 s of speech
+        silent = 120 * worker.SAMPLE_RATE // BLOCK_SIZE
+        blocks = silent + 20 * worker.SAMPLE_RATE // BLOCK_SIZE
+        monkeypatch.setattr(stt.workers, "sd",
+                            _fake_sounddevice(worker, blocks, silent=silent))
+        texts = []
+        worker.partial_text.connect(texts.append)
+        worker.run()
+        assert texts and texts[-1] == "mock text"
+        assert fake_stt_engine.calls
+        assert max(fake_stt_engine.calls) <= worker.WINDOW_SAMPLES
+        # The pause itself is never sent, beyond at most one tick of lead-in
+        speech = (blocks - silent) * BLOCK_SIZE
+        assert max(fake_stt_engine.calls) <= speech + worker.TRANSCRIBE_EVERY
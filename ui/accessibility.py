@@ -1,23 +1,38 @@
 """Accessibility settings manager singleton."""
 
+from contextlib import contextmanager
+from types import MappingProxyType
+
 from PyQt6.QtCore import QObject, Qt, pyqtSignal
-from PyQt6.QtGui import QBrush, QColor, QCursor, QPainter, QPainterPath, QPen, QPixmap
+from PyQt6.QtGui import (
+    QBrush, QColor, QCursor, QPainter, QPainterPath, QPen, QPixmap, QPixmapCache,
+)
 
+from config.brand import ROLE_ACCENTS
 from config.settings import COLORS
 
 
 class AccessibilityManager(QObject):
     """Singleton managing runtime accessibility preferences."""
 
+    # Narrow signals let consumers restyle only for settings they use;
+    # settings_changed follows every change for coarse listeners.
     settings_changed = pyqtSignal()
+    colors_changed = pyqtSignal()    # color-blind mode, high contrast, role accent
+    fonts_changed = pyqtSignal()     # font scale, dyslexia font
+    cursor_changed = pyqtSignal()    # custom cursor
+    motion_changed = pyqtSignal()    # reduced motion
+    spacing_changed = pyqtSignal()   # letter/word spacing, line height
+    focus_changed = pyqtSignal()     # enhanced focus, reading ruler
 
     _instance = None
 
+    # Read-only so get_font_sizes() can hand them out without copying
     FONT_SCALES = {
-        "small": {"base": 14, "heading": 20, "subheading": 16},
-        "medium": {"base": 16, "heading": 24, "subheading": 18},
-        "large": {"base": 20, "heading": 30, "subheading": 22},
-        "extra_large": {"base": 24, "heading": 36, "subheading": 28},
+        "small": MappingProxyType({"base": 14, "heading": 20, "subheading": 16}),
+        "medium": MappingProxyType({"base": 16, "heading": 24, "subheading": 18}),
+        "large": MappingProxyType({"base": 20, "heading": 30, "subheading": 22}),
+        "extra_large": MappingProxyType({"base": 24, "heading": 36, "subheading": 28}),
     }
 
     HIGH_CONTRAST_OVERRIDES = {
@@ -104,6 +119,11 @@ class AccessibilityManager(QObject):
         "pointer_trail": "Pointer with Trail",
     }
 
+    # Valid keys for the choice settings, checked by setters and loaders
+    _FONT_SCALE_KEYS = frozenset(FONT_SCALES)
+    _CB_KEYS = frozenset(COLOR_BLIND_MODES)
+    _CURSOR_KEYS = frozenset(CUSTOM_CURSORS)
+
     @classmethod
     def instance(cls):
         return cls._instance
@@ -128,6 +148,11 @@ class AccessibilityManager(QObject):
         self._word_spacing = 0    # extra px
         self._line_height = 0     # extra px
         self._role_accent = None  # set on login
+        # Cursor pixmaps depend only on the cursor type, so each is painted once
+        self._cursor_cache = {}
+        # Signals deferred while inside batch_update(), in first-seen order
+        self._batch_depth = 0
+        self._batch_pending = {}
 
     # -- properties --
 
@@ -181,88 +206,149 @@ class AccessibilityManager(QObject):
 
     # -- setters --
 
+    def _notify(self, *signals):
+        """Emit the given narrow signals, then settings_changed once.
+
+        Inside batch_update() the signals are only recorded.
+        """
+        if self._batch_depth:
+            for signal in signals:
+                self._batch_pending[signal.signal] = signal
+            return
+        for signal in signals:
+            signal.emit()
+        self.settings_changed.emit()
+
+    @contextmanager
+    def batch_update(self):
+        """Apply several setters with one round of change signals.
+
+        Each affected narrow signal and settings_changed fire once when the
+        outermost batch exits, so listeners restyle once per batch.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_pending:
+                pending = list(self._batch_pending.values())
+                self._batch_pending.clear()
+                self._notify(*pending)
+
     def set_font_scale(self, scale: str):
-        if scale in self.FONT_SCALES and scale != self._font_scale:
+        if scale in self._FONT_SCALE_KEYS and scale != self._font_scale:
             self._font_scale = scale
-            self.settings_changed.emit()
+            self._notify(self.fonts_changed)
 
     def set_high_contrast(self, enabled: bool):
         if enabled != self._high_contrast:
             self._high_contrast = enabled
-            self.settings_changed.emit()
+            self._notify(self.colors_changed)
 
     def set_reduced_motion(self, enabled: bool):
         if enabled != self._reduced_motion:
             self._reduced_motion = enabled
-            self.settings_changed.emit()
+            self._notify(self.motion_changed)
 
     def set_enhanced_focus(self, enabled: bool):
         if enabled != self._enhanced_focus:
             self._enhanced_focus = enabled
-            self.settings_changed.emit()
+            self._notify(self.focus_changed)
 
     def set_color_blind_mode(self, mode: str):
-        if mode in self.COLOR_BLIND_MODES and mode != self._color_blind_mode:
+        if mode in self._CB_KEYS and mode != self._color_blind_mode:
             self._color_blind_mode = mode
-            self.settings_changed.emit()
+            self._notify(self.colors_changed)
 
     def set_dyslexia_font(self, enabled: bool):
         if enabled != self._dyslexia_font:
             self._dyslexia_font = enabled
-            self.settings_changed.emit()
+            self._notify(self.fonts_changed)
 
     def set_custom_cursor(self, cursor: str):
-        if cursor in self.CUSTOM_CURSORS and cursor != self._custom_cursor:
+        if cursor in self._CURSOR_KEYS and cursor != self._custom_cursor:
             self._custom_cursor = cursor
-            self.settings_changed.emit()
+            self._notify(self.cursor_changed)
 
     def set_reading_ruler(self, enabled: bool):
         if enabled != self._reading_ruler:
             self._reading_ruler = enabled
-            self.settings_changed.emit()
+            self._notify(self.focus_changed)
 
     def set_letter_spacing(self, px: int):
-        px = max(0, min(8, px))
+        if px == self._letter_spacing:
+            return
+        px = 0 if px < 0 else (8 if px > 8 else px)
         if px != self._letter_spacing:
             self._letter_spacing = px
-            self.settings_changed.emit()
+            self._notify(self.spacing_changed)
 
     def set_word_spacing(self, px: int):
-        px = max(0, min(12, px))
+        if px == self._word_spacing:
+            return
+        px = 0 if px < 0 else (12 if px > 12 else px)
         if px != self._word_spacing:
             self._word_spacing = px
-            self.settings_changed.emit()
+            self._notify(self.spacing_changed)
 
     def set_line_height(self, px: int):
-        px = max(0, min(12, px))
+        if px == self._line_height:
+            return
+        px = 0 if px < 0 else (12 if px > 12 else px)
         if px != self._line_height:
             self._line_height = px
-            self.settings_changed.emit()
+            self._notify(self.spacing_changed)
 
     def set_role_accent(self, role: str):
-        from config.brand import ROLE_ACCENTS
         if role in ROLE_ACCENTS:
             self._role_accent = role
-            self.settings_changed.emit()
+            self._notify(self.colors_changed)
 
     # -- derived --
 
-    def get_effective_colors(self) -> dict:
-        colors = dict(COLORS)
-        cb_overrides = self.COLOR_BLIND_MODES.get(self._color_blind_mode, {})
-        if cb_overrides:
-            colors.update(cb_overrides)
-        if self._high_contrast:
-            colors.update(self.HIGH_CONTRAST_OVERRIDES)
-        return colors
+    @classmethod
+    def _build_precomputed(cls):
+        """Merge every (color-blind mode, high contrast) palette up front.
+
+        COLORS and the override tables never change at runtime, so the ten
+        possible palettes are built once at import.
+        """
+        cls._PRECOMPUTED = {
+            (mode, hc): MappingProxyType({
+                **COLORS,
+                **cb_overrides,
+                **(cls.HIGH_CONTRAST_OVERRIDES if hc else {}),
+            })
+            for mode, cb_overrides in cls.COLOR_BLIND_MODES.items()
+            for hc in (False, True)
+        }
+
+    def get_effective_colors(self) -> MappingProxyType:
+        """Return the merged palette as a read-only mapping.
+
+        Callers that need to modify it should take ``dict(...)`` of it.
+        """
+        hc = bool(self._high_contrast)
+        colors = self._PRECOMPUTED.get((self._color_blind_mode, hc))
+        return colors if colors is not None else self._PRECOMPUTED[("none", hc)]
 
-    def get_font_sizes(self) -> dict:
-        return dict(self.FONT_SCALES.get(self._font_scale, self.FONT_SCALES["medium"]))
+    def get_font_sizes(self) -> MappingProxyType:
+        """Return the font sizes for the current scale as a read-only mapping."""
+        return self.FONT_SCALES.get(self._font_scale, self.FONT_SCALES["medium"])
 
     def get_cursor(self):
         cursor_type = self._custom_cursor
         if cursor_type == "default":
             return None
+        cursor = self._cursor_cache.get(cursor_type)
+        if cursor is None:
+            cursor = self._make_cursor(cursor_type)
+            if cursor is not None:
+                self._cursor_cache[cursor_type] = cursor
+        return cursor
+
+    def _make_cursor(self, cursor_type):
         if cursor_type == "large_black":
             return self._make_arrow_cursor(32, QColor("black"), QColor("white"), 2)
         elif cursor_type == "large_white":
@@ -275,99 +361,116 @@ class AccessibilityManager(QObject):
             return self._make_arrow_cursor(32, QColor("black"), QColor("white"), 2)
         return None
 
+    # Arrow outlines keyed by pixel size, shared by every cursor type.
+    # Finished pixmaps live in Qt's global QPixmapCache under "a11y:cursor:"
+    # keys, so they outlive any one manager instance.
+    _ARROW_PATHS = {}
+
+    @classmethod
+    def _arrow_path(cls, size):
+        path = cls._ARROW_PATHS.get(size)
+        if path is None:
+            scale = size / 32.0
+            path = QPainterPath()
+            path.moveTo(4 * scale, 4 * scale)
+            path.lineTo(4 * scale, 28 * scale)
+            path.lineTo(12 * scale, 20 * scale)
+            path.lineTo(18 * scale, 28 * scale)
+            path.lineTo(22 * scale, 26 * scale)
+            path.lineTo(16 * scale, 18 * scale)
+            path.lineTo(26 * scale, 18 * scale)
+            path.closeSubpath()
+            cls._ARROW_PATHS[size] = path
+        return path
+
     def _make_arrow_cursor(self, size, fill_color, stroke_color, stroke_width):
-        pixmap = QPixmap(size, size)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        scale = size / 32.0
-        path = QPainterPath()
-        path.moveTo(4 * scale, 4 * scale)
-        path.lineTo(4 * scale, 28 * scale)
-        path.lineTo(12 * scale, 20 * scale)
-        path.lineTo(18 * scale, 28 * scale)
-        path.lineTo(22 * scale, 26 * scale)
-        path.lineTo(16 * scale, 18 * scale)
-        path.lineTo(26 * scale, 18 * scale)
-        path.closeSubpath()
-        pen = QPen(stroke_color, stroke_width)
-        pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
-        painter.setPen(pen)
-        painter.setBrush(QBrush(fill_color))
-        painter.drawPath(path)
-        painter.end()
-        hotspot = int(4 * scale)
+        key = (f"a11y:cursor:arrow:{size}:{fill_color.name()}:"
+               f"{stroke_color.name()}:{stroke_width}")
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = QPixmap(size, size)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            pen = QPen(stroke_color, stroke_width)
+            pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
+            painter.setPen(pen)
+            painter.setBrush(QBrush(fill_color))
+            painter.drawPath(self._arrow_path(size))
+            painter.end()
+            QPixmapCache.insert(key, pixmap)
+        hotspot = int(4 * size / 32.0)
         return QCursor(pixmap, hotspot, hotspot)
 
     def _make_crosshair_cursor(self):
-        size = 32
-        pixmap = QPixmap(size, size)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setPen(QPen(QColor("black"), 3))
-        painter.drawLine(16, 0, 16, 32)
-        painter.drawLine(0, 16, 32, 16)
-        painter.setPen(QPen(QColor("red"), 1))
-        painter.drawLine(16, 0, 16, 32)
-        painter.drawLine(0, 16, 32, 16)
-        painter.setPen(QPen(QColor("red"), 2))
-        painter.setBrush(QBrush(Qt.GlobalColor.transparent))
-        painter.drawEllipse(10, 10, 12, 12)
-        painter.end()
+        key = "a11y:cursor:crosshair:32"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = QPixmap(32, 32)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(QPen(QColor("black"), 3))
+            painter.drawLine(16, 0, 16, 32)
+            painter.drawLine(0, 16, 32, 16)
+            painter.setPen(QPen(QColor("red"), 1))
+            painter.drawLine(16, 0, 16, 32)
+            painter.drawLine(0, 16, 32, 16)
+            painter.setPen(QPen(QColor("red"), 2))
+            painter.setBrush(QBrush(Qt.GlobalColor.transparent))
+            painter.drawEllipse(10, 10, 12, 12)
+            painter.end()
+            QPixmapCache.insert(key, pixmap)
         return QCursor(pixmap, 16, 16)
 
     # -- serialization --
 
     def to_dict(self) -> dict:
-        return {
-            "font_scale": self._font_scale,
-            "high_contrast": self._high_contrast,
-            "reduced_motion": self._reduced_motion,
-            "enhanced_focus": self._enhanced_focus,
-            "color_blind_mode": self._color_blind_mode,
-            "dyslexia_font": self._dyslexia_font,
-            "custom_cursor": self._custom_cursor,
-            "reading_ruler": self._reading_ruler,
-            "letter_spacing": self._letter_spacing,
-            "word_spacing": self._word_spacing,
-            "line_height": self._line_height,
-        }
+        attrs = self.__dict__
+        return {key: attrs[attr] for key, attr, _, _ in self._LOADERS}
+
+    # (key, attribute, accepted values, narrow signal) for load_from_dict().
+    # Accepted values are a frozenset of choices, ``bool`` for flags that
+    # default to False, or ``int`` for pixel values that default to 0.
+    _LOADERS = (
+        ("font_scale", "_font_scale", _FONT_SCALE_KEYS, "fonts_changed"),
+        ("color_blind_mode", "_color_blind_mode", _CB_KEYS, "colors_changed"),
+        ("custom_cursor", "_custom_cursor", _CURSOR_KEYS, "cursor_changed"),
+        ("high_contrast", "_high_contrast", bool, "colors_changed"),
+        ("reduced_motion", "_reduced_motion", bool, "motion_changed"),
+        ("enhanced_focus", "_enhanced_focus", bool, "focus_changed"),
+        ("dyslexia_font", "_dyslexia_font", bool, "fonts_changed"),
+        ("reading_ruler", "_reading_ruler", bool, "focus_changed"),
+        ("letter_spacing", "_letter_spacing", int, "spacing_changed"),
+        ("word_spacing", "_word_spacing", int, "spacing_changed"),
+        ("line_height", "_line_height", int, "spacing_changed"),
+    )
 
     def load_from_dict(self, data: dict):
-        changed = False
-
-        for key, attr, valid in [
-            ("font_scale", "_font_scale", self.FONT_SCALES),
-            ("color_blind_mode", "_color_blind_mode", self.COLOR_BLIND_MODES),
-            ("custom_cursor", "_custom_cursor", self.CUSTOM_CURSORS),
-        ]:
-            val = data.get(key)
-            if val and val in valid and val != getattr(self, attr):
-                setattr(self, attr, val)
-                changed = True
-
-        for key, attr in [
-            ("high_contrast", "_high_contrast"),
-            ("reduced_motion", "_reduced_motion"),
-            ("enhanced_focus", "_enhanced_focus"),
-            ("dyslexia_font", "_dyslexia_font"),
-            ("reading_ruler", "_reading_ruler"),
-        ]:
-            val = data.get(key, False)
-            if val != getattr(self, attr):
-                setattr(self, attr, val)
-                changed = True
-
-        for key, attr in [
-            ("letter_spacing", "_letter_spacing"),
-            ("word_spacing", "_word_spacing"),
-            ("line_height", "_line_height"),
-        ]:
-            val = data.get(key, 0)
-            if isinstance(val, int) and val != getattr(self, attr):
-                setattr(self, attr, max(0, val))
-                changed = True
+        attrs = self.__dict__
+        changed = set()
+
+        for key, attr, valid, signal in self._LOADERS:
+            current = attrs[attr]
+            if valid is bool:
+                val = data.get(key, False)
+                if val == current:
+                    continue
+            elif valid is int:
+                val = data.get(key, 0)
+                if not isinstance(val, int) or val == current:
+                    continue
+                val = max(0, val)
+            else:
+                val = data.get(key)
+                if not val or val not in valid or val == current:
+                    continue
+            attrs[attr] = val
+            changed.add(signal)
 
         if changed:
-            self.settings_changed.emit()
+            self._notify(*(getattr(self, name) for name in sorted(changed)))
+
+
+# Build the precomputed color palettes once, at import
+AccessibilityManager._build_precomputed()
@@ -1,11 +1,17 @@
 """Device-level accessibility preferences persistence."""
 
 import json
+import os
 from pathlib import Path
 
+from PyQt6.QtCore import QCoreApplication, QTimer
+
 _PREFS_DIR = Path.home() / ".accesstwin"
 _PREFS_FILE = _PREFS_DIR / "accessibility_prefs.json"
 
+# Quiet period before a scheduled save is written (ms)
+_SAVE_DELAY_MS = 250
+
 
 def load_prefs() -> dict | None:
     try:
@@ -19,6 +25,49 @@ def load_prefs() -> dict | None:
 def save_prefs(data: dict):
     try:
         _PREFS_DIR.mkdir(parents=True, exist_ok=True)
-        _PREFS_FILE.write_text(json.dumps(data, indent=2))
+        # Write a sibling temp file and swap it in, so a crash mid-write
+        # never leaves a truncated prefs file behind.
+        tmp = _PREFS_FILE.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(data, separators=(",", ":")))
+        os.replace(tmp, _PREFS_FILE)
     except Exception:
         pass
+
+
+class _PendingSave:
+    """Coalesces rapid save requests into one write after a quiet period."""
+
+    def __init__(self):
+        self._data = None
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(_SAVE_DELAY_MS)
+        self._timer.timeout.connect(self.flush)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush)
+
+    def schedule(self, data: dict):
+        self._data = data
+        self._timer.start()  # restarting pushes the write back
+
+    def flush(self):
+        self._timer.stop()
+        if self._data is not None:
+            data, self._data = self._data, None
+            save_prefs(data)
+
+
+_pending = None
+
+
+def save_prefs_later(data: dict):
+    """Save *data* once settings stop changing for a moment.
+
+    Must be called from the GUI thread.  Only the latest data is written;
+    any pending save is flushed when the application quits.
+    """
+    global _pending
+    if _pending is None:
+        _pending = _PendingSave()
+    _pending.schedule(data)
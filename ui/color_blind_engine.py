@@ -1,7 +1,10 @@
 """Color-blind safe palette utilities based on Wong 2011 (Nature Methods)."""
 
+import functools
 import math
 
+import numpy as np
+
 # Wong 2011 color-blind safe palette
 WONG_PALETTE = {
     "black": "#000000",
@@ -16,20 +19,27 @@ WONG_PALETTE = {
 
 
 def _hex_to_rgb(hex_color: str) -> tuple:
-    h = hex_color.lstrip("#")
-    return tuple(int(h[i:i + 2], 16) for i in (0, 2, 4))
+    v = int(hex_color[1:] if hex_color[0] == "#" else hex_color, 16)
+    return (v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF
+
+
+def _linearize(c: int) -> float:
+    """sRGB 8-bit channel to linear light."""
+    cs = c / 255.0
+    return cs / 12.92 if cs <= 0.04045 else ((cs + 0.055) / 1.055) ** 2.4
+
+
+# Channels are always 8-bit, so every linearised value is precomputed once
+_SRGB_LUT = tuple(_linearize(c) for c in range(256))
 
 
 def _relative_luminance(r: int, g: int, b: int) -> float:
     """WCAG 2.x relative luminance."""
-    def linearize(c):
-        cs = c / 255.0
-        return cs / 12.92 if cs <= 0.04045 else ((cs + 0.055) / 1.055) ** 2.4
-    return 0.2126 * linearize(r) + 0.7152 * linearize(g) + 0.0722 * linearize(b)
+    return 0.2126 * _SRGB_LUT[r] + 0.7152 * _SRGB_LUT[g] + 0.0722 * _SRGB_LUT[b]
 
 
-def validate_contrast(fg_hex: str, bg_hex: str) -> float:
-    """Return WCAG contrast ratio between two hex colors."""
+@functools.lru_cache(maxsize=512)
+def _contrast_ratio(fg_hex: str, bg_hex: str) -> float:
     l1 = _relative_luminance(*_hex_to_rgb(fg_hex))
     l2 = _relative_luminance(*_hex_to_rgb(bg_hex))
     lighter = max(l1, l2)
@@ -37,6 +47,37 @@ def validate_contrast(fg_hex: str, bg_hex: str) -> float:
     return (lighter + 0.05) / (darker + 0.05)
 
 
+def validate_contrast(fg_hex: str, bg_hex: str) -> float:
+    """Return WCAG contrast ratio between two hex colors.
+
+    Themes check the same few colors repeatedly, so ratios are memoised;
+    hex strings are lower-cased so "#FFFFFF" and "#ffffff" share an entry.
+    """
+    return _contrast_ratio(fg_hex.lower(), bg_hex.lower())
+
+
+_LUMA_WEIGHTS = np.array([0.2126, 0.7152, 0.0722])
+_SRGB_LUT_ARRAY = np.array(_SRGB_LUT)
+
+
+def _relative_luminance_batch(hex_colors) -> np.ndarray:
+    """WCAG 2.x relative luminance of each hex color, as a 1-D array."""
+    hexes = "".join(h.lstrip("#") for h in hex_colors)
+    rgb = np.frombuffer(bytes.fromhex(hexes), dtype=np.uint8).reshape(-1, 3)
+    return _SRGB_LUT_ARRAY[rgb] @ _LUMA_WEIGHTS
+
+
+def validate_contrast_batch(fg_hexes, bg_hexes) -> np.ndarray:
+    """Return WCAG contrast ratios for every foreground/background pair.
+
+    ``result[i, j]`` is the ratio of ``fg_hexes[i]`` against ``bg_hexes[j]``,
+    so a whole palette can be audited against a theme in one call.
+    """
+    l1 = _relative_luminance_batch(fg_hexes)[:, None]
+    l2 = _relative_luminance_batch(bg_hexes)[None, :]
+    return (np.maximum(l1, l2) + 0.05) / (np.minimum(l1, l2) + 0.05)
+
+
 def get_safe_palette() -> dict:
     """Return the Wong 2011 palette dict."""
     return dict(WONG_PALETTE)
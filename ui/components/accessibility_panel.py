@@ -9,6 +9,17 @@ from PyQt6.QtCore import Qt
 from config.settings import get_colors
 from ui.accessibility import AccessibilityManager
 
+# (label, key) combo entries; the option tables never change at runtime
+_FONT_ITEMS = tuple(
+    (key.replace("_", " ").title(), key) for key in AccessibilityManager.FONT_SCALES
+)
+_COLOR_BLIND_ITEMS = tuple(
+    (label, key) for key, label in AccessibilityManager.COLOR_BLIND_LABELS.items()
+)
+_CURSOR_ITEMS = tuple(
+    (label, key) for key, label in AccessibilityManager.CUSTOM_CURSORS.items()
+)
+
 
 class AccessibilityPanel(QDialog):
     """Comprehensive accessibility settings dialog."""
@@ -20,18 +31,35 @@ class AccessibilityPanel(QDialog):
         self.setMinimumWidth(480)
         self.setAccessibleName("Accessibility Settings Dialog")
         self._build_ui()
+        self.refresh_from_settings()
+        # Keep a reused dialog in sync with changes made elsewhere, and drop
+        # edits that were closed without Apply
+        self.a11y.settings_changed.connect(self.refresh_from_settings)
+        self.finished.connect(self.refresh_from_settings)
+
+    @classmethod
+    def open_for(cls, widget):
+        """Show the dialog for *widget*'s window, building it on first use.
+
+        The dialog is a child of the top-level window, so the toolbar and
+        the dashboards in one window share and reuse a single instance.
+        """
+        window = widget.window()
+        panel = window.findChild(
+            cls, options=Qt.FindChildOption.FindDirectChildrenOnly)
+        if panel is None:
+            panel = cls(window)
+        panel.exec()
 
     def _build_ui(self):
-        c = get_colors()
         layout = QVBoxLayout(self)
         layout.setSpacing(16)
         layout.setContentsMargins(24, 24, 24, 24)
 
-        title = QLabel("Accessibility Settings")
-        title.setStyleSheet(f"font-size: 20px; font-weight: bold; color: {c['primary_text']};")
-        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setAccessibleName("Accessibility Settings")
-        layout.addWidget(title)
+        self._title = QLabel("Accessibility Settings")
+        self._title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._title.setAccessibleName("Accessibility Settings")
+        layout.addWidget(self._title)
 
         # -- Font --
         font_group = QGroupBox("Text & Font")
@@ -41,17 +69,13 @@ class AccessibilityPanel(QDialog):
         self.font_combo = QComboBox()
         self.font_combo.setAccessibleName("Font size")
         self.font_combo.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-        for key in AccessibilityManager.FONT_SCALES:
-            self.font_combo.addItem(key.replace("_", " ").title(), key)
-        idx = self.font_combo.findData(self.a11y.font_scale)
-        if idx >= 0:
-            self.font_combo.setCurrentIndex(idx)
+        for label, key in _FONT_ITEMS:
+            self.font_combo.addItem(label, key)
         font_form.addRow("Font Size:", self.font_combo)
 
         self.dyslexia_cb = QCheckBox("Use dyslexia-friendly font")
         self.dyslexia_cb.setAccessibleName("Dyslexia friendly font")
         self.dyslexia_cb.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-        self.dyslexia_cb.setChecked(self.a11y.dyslexia_font)
         font_form.addRow(self.dyslexia_cb)
 
         layout.addWidget(font_group)
@@ -65,7 +89,6 @@ class AccessibilityPanel(QDialog):
         self.letter_spacing_spin.setAccessibleName("Letter spacing in pixels")
         self.letter_spacing_spin.setRange(0, 8)
         self.letter_spacing_spin.setSuffix(" px")
-        self.letter_spacing_spin.setValue(self.a11y.letter_spacing)
         self.letter_spacing_spin.setFixedHeight(36)
         spacing_form.addRow("Letter Spacing:", self.letter_spacing_spin)
 
@@ -73,7 +96,6 @@ class AccessibilityPanel(QDialog):
         self.word_spacing_spin.setAccessibleName("Word spacing in pixels")
         self.word_spacing_spin.setRange(0, 12)
         self.word_spacing_spin.setSuffix(" px")
-        self.word_spacing_spin.setValue(self.a11y.word_spacing)
         self.word_spacing_spin.setFixedHeight(36)
         spacing_form.addRow("Word Spacing:", self.word_spacing_spin)
 
@@ -81,7 +103,6 @@ class AccessibilityPanel(QDialog):
         self.line_height_spin.setAccessibleName("Extra line height in pixels")
         self.line_height_spin.setRange(0, 12)
         self.line_height_spin.setSuffix(" px")
-        self.line_height_spin.setValue(self.a11y.line_height)
         self.line_height_spin.setFixedHeight(36)
         spacing_form.addRow("Line Height Extra:", self.line_height_spin)
 
@@ -95,17 +116,13 @@ class AccessibilityPanel(QDialog):
         self.high_contrast_cb = QCheckBox("High contrast mode")
         self.high_contrast_cb.setAccessibleName("High contrast mode")
         self.high_contrast_cb.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-        self.high_contrast_cb.setChecked(self.a11y.high_contrast)
         color_form.addRow(self.high_contrast_cb)
 
         self.cb_combo = QComboBox()
         self.cb_combo.setAccessibleName("Color blind mode")
         self.cb_combo.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-        for key, label in AccessibilityManager.COLOR_BLIND_LABELS.items():
+        for label, key in _COLOR_BLIND_ITEMS:
             self.cb_combo.addItem(label, key)
-        idx = self.cb_combo.findData(self.a11y.color_blind_mode)
-        if idx >= 0:
-            self.cb_combo.setCurrentIndex(idx)
         color_form.addRow("Color Blind Mode:", self.cb_combo)
 
         layout.addWidget(color_group)
@@ -118,17 +135,13 @@ class AccessibilityPanel(QDialog):
         self.cursor_combo = QComboBox()
         self.cursor_combo.setAccessibleName("Cursor style")
         self.cursor_combo.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-        for key, label in AccessibilityManager.CUSTOM_CURSORS.items():
+        for label, key in _CURSOR_ITEMS:
             self.cursor_combo.addItem(label, key)
-        idx = self.cursor_combo.findData(self.a11y.custom_cursor)
-        if idx >= 0:
-            self.cursor_combo.setCurrentIndex(idx)
         cursor_form.addRow("Cursor Style:", self.cursor_combo)
 
         self.ruler_cb = QCheckBox("Reading ruler (highlight band)")
         self.ruler_cb.setAccessibleName("Reading ruler")
         self.ruler_cb.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-        self.ruler_cb.setChecked(self.a11y.reading_ruler)
         cursor_form.addRow(self.ruler_cb)
 
         layout.addWidget(cursor_group)
@@ -141,13 +154,11 @@ class AccessibilityPanel(QDialog):
         self.reduced_motion_cb = QCheckBox("Reduce motion / animations")
         self.reduced_motion_cb.setAccessibleName("Reduce motion")
         self.reduced_motion_cb.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-        self.reduced_motion_cb.setChecked(self.a11y.reduced_motion)
         motion_form.addRow(self.reduced_motion_cb)
 
         self.enhanced_focus_cb = QCheckBox("Enhanced focus indicators")
         self.enhanced_focus_cb.setAccessibleName("Enhanced focus indicators")
         self.enhanced_focus_cb.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-        self.enhanced_focus_cb.setChecked(self.a11y.enhanced_focus)
         motion_form.addRow(self.enhanced_focus_cb)
 
         layout.addWidget(motion_group)
@@ -156,20 +167,12 @@ class AccessibilityPanel(QDialog):
         btn_layout = QHBoxLayout()
         btn_layout.addStretch()
 
-        apply_btn = QPushButton("Apply")
-        apply_btn.setAccessibleName("Apply accessibility settings")
-        apply_btn.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-        apply_btn.setFixedHeight(44)
-        apply_btn.clicked.connect(self._apply)
-        apply_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
-                    stop:0 {c['primary']}, stop:1 {c['tertiary']});
-                color: white; border: none; border-radius: 8px;
-                padding: 8px 24px; font-weight: bold;
-            }}
-        """)
-        btn_layout.addWidget(apply_btn)
+        self._apply_btn = QPushButton("Apply")
+        self._apply_btn.setAccessibleName("Apply accessibility settings")
+        self._apply_btn.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        self._apply_btn.setFixedHeight(44)
+        self._apply_btn.clicked.connect(self._apply)
+        btn_layout.addWidget(self._apply_btn)
 
         close_btn = QPushButton("Close")
         close_btn.setAccessibleName("Close accessibility settings")
@@ -180,15 +183,51 @@ class AccessibilityPanel(QDialog):
 
         layout.addLayout(btn_layout)
 
+    def refresh_from_settings(self):
+        """Sync controls and theme colors with the current settings.
+
+        Lets one dialog instance be reopened instead of rebuilt.
+        """
+        for combo, value in (
+            (self.font_combo, self.a11y.font_scale),
+            (self.cb_combo, self.a11y.color_blind_mode),
+            (self.cursor_combo, self.a11y.custom_cursor),
+        ):
+            idx = combo.findData(value)
+            if idx >= 0:
+                combo.setCurrentIndex(idx)
+        self.dyslexia_cb.setChecked(self.a11y.dyslexia_font)
+        self.letter_spacing_spin.setValue(self.a11y.letter_spacing)
+        self.word_spacing_spin.setValue(self.a11y.word_spacing)
+        self.line_height_spin.setValue(self.a11y.line_height)
+        self.high_contrast_cb.setChecked(self.a11y.high_contrast)
+        self.ruler_cb.setChecked(self.a11y.reading_ruler)
+        self.reduced_motion_cb.setChecked(self.a11y.reduced_motion)
+        self.enhanced_focus_cb.setChecked(self.a11y.enhanced_focus)
+
+        c = get_colors()
+        self._title.setStyleSheet(
+            f"font-size: 20px; font-weight: bold; color: {c['primary_text']};")
+        self._apply_btn.setStyleSheet(f"""
+            QPushButton {{
+                background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
+                    stop:0 {c['primary']}, stop:1 {c['tertiary']});
+                color: white; border: none; border-radius: 8px;
+                padding: 8px 24px; font-weight: bold;
+            }}
+        """)
+
     def _apply(self):
-        self.a11y.set_font_scale(self.font_combo.currentData())
-        self.a11y.set_dyslexia_font(self.dyslexia_cb.isChecked())
-        self.a11y.set_letter_spacing(self.letter_spacing_spin.value())
-        self.a11y.set_word_spacing(self.word_spacing_spin.value())
-        self.a11y.set_line_height(self.line_height_spin.value())
-        self.a11y.set_high_contrast(self.high_contrast_cb.isChecked())
-        self.a11y.set_color_blind_mode(self.cb_combo.currentData())
-        self.a11y.set_custom_cursor(self.cursor_combo.currentData())
-        self.a11y.set_reading_ruler(self.ruler_cb.isChecked())
-        self.a11y.set_reduced_motion(self.reduced_motion_cb.isChecked())
-        self.a11y.set_enhanced_focus(self.enhanced_focus_cb.isChecked())
+        # One batch, so listeners restyle once rather than once per setter
+        with self.a11y.batch_update():
+            self.a11y.set_font_scale(self.font_combo.currentData())
+            self.a11y.set_dyslexia_font(self.dyslexia_cb.isChecked())
+            self.a11y.set_letter_spacing(self.letter_spacing_spin.value())
+            self.a11y.set_word_spacing(self.word_spacing_spin.value())
+            self.a11y.set_line_height(self.line_height_spin.value())
+            self.a11y.set_high_contrast(self.high_contrast_cb.isChecked())
+            self.a11y.set_color_blind_mode(self.cb_combo.currentData())
+            self.a11y.set_custom_cursor(self.cursor_combo.currentData())
+            self.a11y.set_reading_ruler(self.ruler_cb.isChecked())
+            self.a11y.set_reduced_motion(self.reduced_motion_cb.isChecked())
+            self.a11y.set_enhanced_focus(self.enhanced_focus_cb.isChecked())
@@ -32,5 +32,4 @@ class AccessibilityToolbar(QWidget):
 
     def _open_full_settings(self):
         from ui.components.accessibility_panel import AccessibilityPanel
-        dlg = AccessibilityPanel(self.window())
-        dlg.exec()
+        AccessibilityPanel.open_for(self)
@@ -1,5 +1,7 @@
 """Navigation breadcrumb trail widget."""
 
+from functools import partial
+
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel, QPushButton
 from PyQt6.QtCore import Qt, pyqtSignal
 
@@ -14,6 +16,11 @@ class Breadcrumb(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._crumbs: list[str] = []
+        self._styles_for = None
+        self._styles: tuple[str, str, str] = ("", "", "")
+        self._applied_styles = None
+        # (separator or None, crumb widget) per crumb, in layout order
+        self._items: list[tuple] = []
         self._layout = QHBoxLayout(self)
         self._layout.setContentsMargins(0, 0, 0, 0)
         self._layout.setSpacing(4)
@@ -21,39 +28,89 @@ class Breadcrumb(QWidget):
         self.setAccessibleName("Breadcrumb navigation")
 
     def set_crumbs(self, crumbs: list[str]):
-        """Replace the breadcrumb trail."""
+        """Replace the breadcrumb trail.
+
+        Crumbs that keep their role (link vs. current page) are reused and
+        just relabelled; only the widgets past that point are rebuilt.
+        """
         self._crumbs = crumbs
-        # Clear existing widgets (except trailing stretch)
-        while self._layout.count() > 1:
-            item = self._layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        # One repaint for the whole rebuild instead of one per widget change
+        self.setUpdatesEnabled(False)
+        try:
+            self._sync_items(crumbs)
+        finally:
+            self.setUpdatesEnabled(True)
 
-        c = get_colors()
-        for i, text in enumerate(crumbs):
+    def _sync_items(self, crumbs: list[str]):
+        styles = self._stylesheets()
+        sep_css, btn_css, current_css = styles
+
+        keep = 0
+        if styles is self._applied_styles:
+            last = len(crumbs) - 1
+            for i, (_sep, widget) in enumerate(self._items[:len(crumbs)]):
+                if isinstance(widget, QPushButton) == (i == last):
+                    break
+                keep = i + 1
+        self._applied_styles = styles
+
+        for sep, widget in self._items[keep:]:
+            for w in (sep, widget):
+                if w is not None:
+                    self._layout.removeWidget(w)
+                    w.deleteLater()
+        del self._items[keep:]
+
+        for i in range(keep):
+            widget = self._items[i][1]
+            widget.setText(crumbs[i])
+            if isinstance(widget, QPushButton):
+                widget.setAccessibleName(f"Navigate to {crumbs[i]}")
+
+        for i in range(keep, len(crumbs)):
+            text = crumbs[i]
+            sep = None
             if i > 0:
                 sep = QLabel(">")
-                sep.setStyleSheet(f"color: {c['text_muted']}; font-size: 12px;")
+                sep.setStyleSheet(sep_css)
                 self._layout.insertWidget(self._layout.count() - 1, sep)
 
             if i < len(crumbs) - 1:
-                btn = QPushButton(text)
-                btn.setAccessibleName(f"Navigate to {text}")
-                btn.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-                btn.setCursor(Qt.CursorShape.PointingHandCursor)
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background: transparent; border: none;
-                        color: {c['primary_text']}; font-size: 12px;
-                        text-decoration: underline; padding: 2px 4px;
-                        min-height: 0; min-width: 0;
-                    }}
-                    QPushButton:hover {{ color: {c['text']}; }}
-                """)
-                idx = i
-                btn.clicked.connect(lambda checked, x=idx: self.crumb_clicked.emit(x))
-                self._layout.insertWidget(self._layout.count() - 1, btn)
+                widget = QPushButton(text)
+                widget.setAccessibleName(f"Navigate to {text}")
+                widget.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+                widget.setCursor(Qt.CursorShape.PointingHandCursor)
+                widget.setStyleSheet(btn_css)
+                widget.clicked.connect(partial(self._emit_crumb, i))
             else:
-                lbl = QLabel(text)
-                lbl.setStyleSheet(f"color: {c['text']}; font-size: 12px; font-weight: bold;")
-                self._layout.insertWidget(self._layout.count() - 1, lbl)
+                widget = QLabel(text)
+                widget.setStyleSheet(current_css)
+            self._layout.insertWidget(self._layout.count() - 1, widget)
+            self._items.append((sep, widget))
+
+    def _emit_crumb(self, index: int, checked: bool = False):
+        self.crumb_clicked.emit(index)
+
+    def _stylesheets(self) -> tuple[str, str, str]:
+        """Return (separator, link, current) stylesheets for the theme.
+
+        get_colors() hands back the same mapping until the theme changes,
+        so the strings are only re-formatted when that mapping does.
+        """
+        c = get_colors()
+        if c is not self._styles_for:
+            self._styles_for = c
+            self._styles = (
+                f"color: {c['text_muted']}; font-size: 12px;",
+                f"""
+                QPushButton {{
+                    background: transparent; border: none;
+                    color: {c['primary_text']}; font-size: 12px;
+                    text-decoration: underline; padding: 2px 4px;
+                    min-height: 0; min-width: 0;
+                }}
+                QPushButton:hover {{ color: {c['text']}; }}
+                """,
+                f"color: {c['text']}; font-size: 12px; font-weight: bold;",
+            )
+        return self._styles
@@ -1,11 +1,15 @@
 """Shared helpers for chart components."""
 
+import math
 import re
-from collections import defaultdict
-from datetime import timedelta
+from collections import Counter
+from datetime import date
+
+import numpy as np
 
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
 from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QPainter, QPen, QPixmap, QRegion
 
 from config.settings import get_colors
 
@@ -20,13 +24,92 @@ CHART_PALETTE = [
     "#0f3460",  # dark input blue
     "#ff4d5e",  # error red
 ]
+# Same palette as QColors, parsed once for the painters
+CHART_PALETTE_QCOLORS = tuple(QColor(h) for h in CHART_PALETTE)
+
+# Above this many logs, group_logs_by_week buckets with NumPy instead of
+# a per-log Python loop.
+_VECTORIZE_MIN_LOGS = 512
+
+_EFFECTIVENESS_RE = re.compile(
+    r"effectiveness\s+rated:\s*(\d+(?:\.\d+)?)\s*/\s*5", re.IGNORECASE
+)
+
+
+_pens_for = None
+_pens: dict = {}
+
+
+def chart_pens() -> dict:
+    """Return the theme QPens shared by the chart widgets.
+
+    get_colors() returns the same mapping until the theme changes, so the
+    pens are only rebuilt then rather than on every paint.
+    """
+    global _pens_for, _pens
+    c = get_colors()
+    if c is not _pens_for:
+        _pens = {
+            "text": QPen(QColor(c["text"])),
+            "muted": QPen(QColor(c["text_muted"])),
+            "grid": QPen(QColor(c["dark_border"]), 1, Qt.PenStyle.DotLine),
+            "axis": QPen(QColor(c["dark_border"]), 2),
+            "focus": QPen(QColor(c["primary"]), 2, Qt.PenStyle.DashLine),
+        }
+        _pens_for = c
+    return _pens
+
+
+def update_focus_ring(widget: QWidget):
+    """Repaint only the border band where a chart draws its focus ring.
+
+    Used from focusInEvent/focusOutEvent instead of QWidget's default
+    full-widget update; only that band of the cached chart is re-blitted.
+    """
+    r = widget.rect()
+    widget.update(QRegion(r).subtracted(QRegion(r.adjusted(6, 6, -6, -6))))
+
+
+class ChartPixmapCache:
+    """Rendered chart body, reused until the data, size or theme changes.
+
+    Charts call invalidate() when set_data() receives different data; the
+    size, device pixel ratio and get_colors() mapping are checked on every
+    paint, so resizes and theme switches re-render on their own.
+    """
+
+    def __init__(self):
+        self._pixmap: QPixmap | None = None
+        self._key: tuple | None = None
+        self._colors = None
+
+    def invalidate(self):
+        self._pixmap = None
+
+    def pixmap(self, widget: QWidget, render) -> QPixmap:
+        """Return the chart image, calling ``render(painter)`` if it is stale."""
+        c = get_colors()
+        dpr = widget.devicePixelRatioF()
+        key = (widget.width(), widget.height(), dpr)
+        if self._pixmap is None or key != self._key or c is not self._colors:
+            pixmap = QPixmap(math.ceil(key[0] * dpr), math.ceil(key[1] * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            render(painter)
+            painter.end()
+            self._pixmap = pixmap
+            self._key = key
+            self._colors = c
+        return self._pixmap
 
 
 def parse_effectiveness_rating(outcome_notes: str) -> float | None:
     """Extract 'Effectiveness rated: X/5' from outcome notes, return float or None."""
     if not outcome_notes:
         return None
-    m = re.search(r"[Ee]ffectiveness\s+rated:\s*(\d+(?:\.\d+)?)\s*/\s*5", outcome_notes)
+    m = _EFFECTIVENESS_RE.search(outcome_notes)
     if m:
         return float(m.group(1))
     return None
@@ -36,23 +119,34 @@ def group_logs_by_week(logs) -> list[dict]:
     """Group logs by ISO week, return [{"label": "Jan 6", "value": count}, ...]."""
     if not logs:
         return []
-    buckets: dict[str, int] = defaultdict(int)
-    week_starts: dict[str, object] = {}
-    for log in logs:
-        dt = log.created_at
-        if not dt:
-            continue
-        # Monday of the ISO week
-        monday = dt - timedelta(days=dt.weekday())
-        key = monday.strftime("%Y-%m-%d")
-        buckets[key] += 1
-        if key not in week_starts:
-            week_starts[key] = monday
-    result = []
-    for key in sorted(buckets):
-        label = week_starts[key].strftime("%b %d")
-        result.append({"label": label, "value": buckets[key]})
-    return result
+    if len(logs) >= _VECTORIZE_MIN_LOGS:
+        return _group_logs_by_week_np(logs)
+    # Keyed by the Monday's ordinal: no per-log date formatting, and the
+    # keys sort chronologically as plain ints.  Counter tallies the
+    # generator in C, one dict probe per log.
+    buckets = Counter(
+        dt.toordinal() - dt.weekday()
+        for dt in (log.created_at for log in logs)
+        if dt
+    )
+    return [
+        {"label": date.fromordinal(key).strftime("%b %d"), "value": buckets[key]}
+        for key in sorted(buckets)
+    ]
+
+
+def _group_logs_by_week_np(logs) -> list[dict]:
+    """Vectorised group_logs_by_week for large log lists."""
+    # Proleptic ordinals: day 1 (0001-01-01) is a Monday
+    days = np.fromiter(
+        (log.created_at.toordinal() for log in logs if log.created_at),
+        dtype=np.int64,
+    )
+    mondays, counts = np.unique(days - (days - 1) % 7, return_counts=True)
+    return [
+        {"label": date.fromordinal(int(d)).strftime("%b %d"), "value": int(n)}
+        for d, n in zip(mondays, counts)
+    ]
 
 
 def group_logs_by_category(logs, supports_map: dict) -> list[dict]:
@@ -62,45 +156,39 @@ def group_logs_by_category(logs, supports_map: dict) -> list[dict]:
     """
     if not logs:
         return []
-    counts: dict[str, int] = defaultdict(int)
+    counts: Counter = Counter()
+    # One .title() per distinct category rather than per log
+    titles: dict[str, str] = {}
     for log in logs:
         support = supports_map.get(log.support_id)
-        cat = support.category.title() if support and support.category else "General"
+        raw = support.category if support and support.category else None
+        if raw is None:
+            counts["General"] += 1
+            continue
+        cat = titles.get(raw)
+        if cat is None:
+            cat = titles[raw] = raw.title()
         counts[cat] += 1
-    result = sorted(
-        [{"label": k, "value": v} for k, v in counts.items()],
-        key=lambda d: d["value"],
-        reverse=True,
-    )
-    return result
+    return [{"label": k, "value": v} for k, v in counts.most_common()]
 
 
 def build_chart_card(title: str, chart_widget: QWidget) -> QWidget:
-    """Wrap a chart widget in a styled dark card with a title label."""
-    c = get_colors()
+    """Wrap a chart widget in a styled dark card with a title label.
+
+    The card is styled by the ``chartCard`` rules in the main stylesheet,
+    which also clear the border and background of the wrapped chart.
+    """
     card = QWidget()
-    card.setStyleSheet(f"""
-        QWidget {{
-            background: {c['dark_card']};
-            border: 1px solid {c['dark_border']};
-            border-radius: 12px;
-        }}
-    """)
+    card.setObjectName("chartCard")
     layout = QVBoxLayout(card)
     layout.setContentsMargins(16, 12, 16, 12)
     layout.setSpacing(8)
 
     lbl = QLabel(title)
-    lbl.setStyleSheet(
-        f"font-size: 14px; font-weight: bold; color: {c['text']}; "
-        "border: none; background: transparent;"
-    )
+    lbl.setObjectName("chartCardTitle")
     lbl.setAccessibleName(title)
     layout.addWidget(lbl)
 
-    chart_widget.setStyleSheet(
-        chart_widget.styleSheet() + " border: none; background: transparent;"
-    )
     layout.addWidget(chart_widget)
 
     return card
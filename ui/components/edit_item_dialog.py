@@ -15,6 +15,7 @@ PRIORITY_CHOICES = [
     ("high", "High"),
     ("non-negotiable", "Non-Negotiable"),
 ]
+_PRIORITY_INDEX = {value: i for i, (value, _) in enumerate(PRIORITY_CHOICES)}
 
 
 class EditItemDialog(QDialog):
@@ -62,11 +63,10 @@ class EditItemDialog(QDialog):
         priority_label.setBuddy(self._priority_combo)
         for value, display in PRIORITY_CHOICES:
             self._priority_combo.addItem(display, value)
-        # Select current priority
-        for i, (value, _) in enumerate(PRIORITY_CHOICES):
-            if value == priority:
-                self._priority_combo.setCurrentIndex(i)
-                break
+        # Select current priority; unknown values fall back to "medium"
+        self._priority_combo.setCurrentIndex(
+            _PRIORITY_INDEX.get(priority, _PRIORITY_INDEX["medium"])
+        )
         layout.addWidget(self._priority_combo)
 
         # Buttons
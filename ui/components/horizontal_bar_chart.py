@@ -1,11 +1,15 @@
 """Horizontal bar chart widget drawn with QPainter."""
 
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtCore import Qt, QRectF
-from PyQt6.QtGui import QPainter, QColor, QFont, QPen
+from PyQt6.QtCore import Qt, QPointF, QRectF
+from PyQt6.QtGui import QPainter, QPainterPath, QFont, QFontMetricsF
 
-from config.settings import get_colors
-from ui.components.chart_utils import CHART_PALETTE
+from ui.components.chart_utils import (
+    CHART_PALETTE_QCOLORS, ChartPixmapCache, chart_pens, update_focus_ring,
+)
+
+# Longer charts are described by their first and last few rows only
+_MAX_DESC_ITEMS = 10
 
 
 class HorizontalBarChart(QWidget):
@@ -21,79 +25,139 @@ class HorizontalBarChart(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._data: list[dict] = []
+        self._description_stale = False
+        self._rows: list[tuple] = []
+        self._bar_area = 0
+        self._bar_paths: dict = {}
+        self._font = QFont()
+        self._font.setPixelSize(12)
+        self._metrics = QFontMetricsF(self._font)
+        self._pixmap_cache = ChartPixmapCache()
         self.setAccessibleName("Horizontal bar chart")
         self.setFocusPolicy(Qt.FocusPolicy.TabFocus)
 
     def set_data(self, data: list[dict]):
         """Set data as [{"label": str, "value": int/float}, ...]."""
-        self._data = data or []
+        data = data or []
+        # Refreshes often pass the same rows again; keep the rendered chart
+        if data != self._data:
+            self._pixmap_cache.invalidate()
+        self._data = data
         row_h = self.BAR_HEIGHT + self.ROW_SPACING
         total = self.PADDING_TOP + row_h * max(len(self._data), 1) + self.PADDING_BOTTOM
         self.setFixedHeight(total)
-        self._update_accessible_description()
+        # Hidden charts are not read out; describe them when next shown
+        self._description_stale = True
+        if self.isVisible():
+            self._update_accessible_description()
+        self._layout_geometry()
         self.update()
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._layout_geometry()
+
+    def _layout_geometry(self):
+        """Lay out each row's bar and text; redone on data or size change.
+
+        Label and value positions are resolved here from the font metrics
+        so paintEvent can use the plain point overload of drawText().
+        """
+        self._bar_area = self.width() - self.LABEL_WIDTH - self.VALUE_WIDTH - 8
+        max_val = max((d["value"] for d in self._data), default=0) or 1
+        row_h = self.BAR_HEIGHT + self.ROW_SPACING
+        fm = self._metrics
+        # Baseline of vertically centred text, relative to the row top
+        baseline = (self.BAR_HEIGHT - fm.height()) / 2 + fm.ascent()
+        label_right = self.LABEL_WIDTH - 4
+        self._value_x = self.LABEL_WIDTH + self._bar_area + 4
+        rows = []
+        for i, item in enumerate(self._data):
+            y = self.PADDING_TOP + i * row_h
+            label = item["label"][:14]
+            rows.append((
+                y,
+                max(4, (item["value"] / max_val) * self._bar_area),
+                label,
+                label_right - fm.horizontalAdvance(label),
+                str(item["value"]),
+                y + baseline,
+            ))
+        self._rows = rows
+
+        # One path per palette color, so paintEvent fills all bars of a
+        # color in a single call
+        n_colors = len(CHART_PALETTE_QCOLORS)
+        paths: dict[int, QPainterPath] = {}
+        for i, (y, bar_w, *_text) in enumerate(rows):
+            path = paths.get(i % n_colors)
+            if path is None:
+                path = paths[i % n_colors] = QPainterPath()
+            path.addRoundedRect(
+                QRectF(self.LABEL_WIDTH, y + 2, bar_w, self.BAR_HEIGHT - 4), 4, 4)
+        self._bar_paths = paths
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._description_stale:
+            self._update_accessible_description()
+
     def _update_accessible_description(self):
         """Build a text summary of the chart data for screen readers."""
+        self._description_stale = False
         if not self._data:
             self.setAccessibleDescription("No data available.")
             return
-        parts = [f"{d['label']}: {d['value']}" for d in self._data]
-        self.setAccessibleDescription("Bar chart data: " + "; ".join(parts))
+        n = len(self._data)
+        if n <= _MAX_DESC_ITEMS:
+            rows = "; ".join(f"{d['label']}: {d['value']}" for d in self._data)
+        else:
+            half = _MAX_DESC_ITEMS // 2
+            first = "; ".join(f"{d['label']}: {d['value']}" for d in self._data[:half])
+            last = "; ".join(f"{d['label']}: {d['value']}" for d in self._data[-half:])
+            rows = f"{first}; ... ({n - _MAX_DESC_ITEMS} more); {last}"
+        self.setAccessibleDescription("Bar chart data: " + rows)
+
+    def focusInEvent(self, event):
+        update_focus_ring(self)
+
+    def focusOutEvent(self, event):
+        update_focus_ring(self)
 
     def paintEvent(self, event):
-        if not self._data:
+        if not self._data or self.width() <= 0:
             return
-        c = get_colors()
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        max_val = max(d["value"] for d in self._data) or 1
-        w = self.width()
-        bar_area = w - self.LABEL_WIDTH - self.VALUE_WIDTH - 8
+        painter.drawPixmap(0, 0, self._pixmap_cache.pixmap(self, self._paint_chart))
 
-        font = QFont()
-        font.setPixelSize(12)
-        painter.setFont(font)
+        # Focus indicator
+        if self.hasFocus():
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(chart_pens()["focus"])
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawRoundedRect(
+                QRectF(1, 1, self.width() - 2, self.height() - 2), 4, 4)
 
-        y = self.PADDING_TOP
-        for i, item in enumerate(self._data):
-            color = QColor(CHART_PALETTE[i % len(CHART_PALETTE)])
+        painter.end()
 
-            # Label
-            painter.setPen(QPen(QColor(c["text_muted"])))
-            label_rect = QRectF(0, y, self.LABEL_WIDTH - 4, self.BAR_HEIGHT)
-            painter.drawText(
-                label_rect,
-                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
-                item["label"][:14],
-            )
-
-            # Bar
-            bar_w = max(4, (item["value"] / max_val) * bar_area)
-            bar_rect = QRectF(self.LABEL_WIDTH, y + 2, bar_w, self.BAR_HEIGHT - 4)
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(color)
-            painter.drawRoundedRect(bar_rect, 4, 4)
+    def _paint_chart(self, painter: QPainter):
+        """Draw the bars and their text into the chart's cached pixmap."""
+        pens = chart_pens()
+        value_x = self._value_x
 
-            # Value
-            painter.setPen(QPen(QColor(c["text"])))
-            val_rect = QRectF(
-                self.LABEL_WIDTH + bar_area + 4, y, self.VALUE_WIDTH, self.BAR_HEIGHT,
-            )
-            painter.drawText(
-                val_rect,
-                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
-                str(item["value"]),
-            )
+        painter.setFont(self._font)
 
-            y += self.BAR_HEIGHT + self.ROW_SPACING
+        # Bars
+        painter.setPen(Qt.PenStyle.NoPen)
+        for color_index, path in self._bar_paths.items():
+            painter.setBrush(CHART_PALETTE_QCOLORS[color_index])
+            painter.drawPath(path)
 
-        # Focus indicator
-        if self.hasFocus():
-            focus_pen = QPen(QColor(c["primary"]), 2, Qt.PenStyle.DashLine)
-            painter.setPen(focus_pen)
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.drawRoundedRect(QRectF(1, 1, w - 2, self.height() - 2), 4, 4)
+        for _y, _bar_w, label, label_x, value, text_y in self._rows:
+            # Label
+            painter.setPen(pens["muted"])
+            painter.drawText(QPointF(label_x, text_y), label)
 
-        painter.end()
+            # Value
+            painter.setPen(pens["text"])
+            painter.drawText(QPointF(value_x, text_y), value)
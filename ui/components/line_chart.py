@@ -1,11 +1,37 @@
 """Line chart widget drawn with QPainter (effectiveness trends)."""
 
+import numpy as np
+
 from PyQt6.QtWidgets import QWidget
 from PyQt6.QtCore import Qt, QPointF, QRectF
-from PyQt6.QtGui import QPainter, QColor, QFont, QPen, QPainterPath, QLinearGradient
+from PyQt6.QtGui import (
+    QPainter, QColor, QFont, QFontMetricsF, QPen, QPainterPath,
+    QLinearGradient, QPolygonF, QStaticText, QTextOption, QTransform,
+)
+
+from ui.components.chart_utils import (
+    CHART_PALETTE_QCOLORS, ChartPixmapCache, chart_pens, update_focus_ring,
+)
+
+# Longer series map their values to points with NumPy
+_VECTORIZE_MIN_POINTS = 32
+
+_LINE_PEN = QPen(CHART_PALETTE_QCOLORS[0], 2)
+_FILL_TOP = QColor(CHART_PALETTE_QCOLORS[0])
+_FILL_TOP.setAlpha(60)
+_FILL_BOTTOM = QColor(CHART_PALETTE_QCOLORS[0])
+_FILL_BOTTOM.setAlpha(10)
 
-from config.settings import get_colors
-from ui.components.chart_utils import CHART_PALETTE
+
+def _static_label(text: str, font: QFont, width: float, align) -> QStaticText:
+    """Prepare a one-line label aligned within *width* pixels."""
+    label = QStaticText(text)
+    label.setTextWidth(width)
+    option = QTextOption(align)
+    option.setWrapMode(QTextOption.WrapMode.NoWrap)
+    label.setTextOption(option)
+    label.prepare(QTransform(), font)
+    return label
 
 
 class LineChart(QWidget):
@@ -20,17 +46,110 @@ class LineChart(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._data: list[dict] = []
+        self._description_stale = False
+        self._polyline = QPolygonF()
+        self._pixmap_cache = ChartPixmapCache()
+        self._label_font = QFont()
+        self._label_font.setPixelSize(10)
+        self._y_label_offset = QFontMetricsF(self._label_font).height() / 2
+        # Axis numerals are laid out once and redrawn without re-shaping
+        self._y_labels = [
+            _static_label(str(val), self._label_font, self.PAD_LEFT - 4,
+                          Qt.AlignmentFlag.AlignRight)
+            for val in range(1, 6)
+        ]
         self.setFixedHeight(self.FIXED_HEIGHT)
         self.setAccessibleName("Effectiveness trend line chart")
         self.setFocusPolicy(Qt.FocusPolicy.TabFocus)
 
     def set_data(self, data: list[dict]):
         """Set data as [{"date": str, "value": float (1-5)}, ...]."""
-        self._data = data or []
-        self._update_accessible_description()
+        data = data or []
+        # Refreshes often pass the same points again; keep the rendered chart
+        if data != self._data:
+            self._pixmap_cache.invalidate()
+        self._data = data
+        # Hidden charts are not read out; describe them when next shown
+        self._description_stale = True
+        if self.isVisible():
+            self._update_accessible_description()
+        # Show at most 6 date labels to avoid overlap
+        n = len(self._data)
+        self._label_indices = range(0, n, max(1, n // 6))
+        self._date_labels = {
+            i: _static_label(self._data[i].get("date", ""), self._label_font,
+                             60, Qt.AlignmentFlag.AlignHCenter)
+            for i in self._label_indices
+        }
+        self._layout_geometry()
         self.update()
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._layout_geometry()
+
+    def _layout_geometry(self):
+        """Map the data to screen geometry; redone only on data or size change."""
+        self._polyline = QPolygonF()
+        self._fill_path = None
+        self._grid_ys: list[float] = []
+        w = self.width()
+        h = self.height()
+        plot_x = self.PAD_LEFT
+        plot_y = self.PAD_TOP
+        plot_w = w - self.PAD_LEFT - self.PAD_RIGHT
+        plot_h = h - self.PAD_TOP - self.PAD_BOTTOM
+        if not self._data or plot_w < 10 or plot_h < 10:
+            return
+
+        # Y-axis grid lines (1 through 5)
+        self._grid_ys = [plot_y + plot_h - ((val - 1) / 4) * plot_h
+                         for val in range(1, 6)]
+
+        # Points live in one QPolygonF buffer rather than a list of QPointF
+        n = len(self._data)
+        polygon = self._polyline
+        if n > _VECTORIZE_MIN_POINTS:
+            values = np.fromiter((d["value"] for d in self._data),
+                                 dtype=np.float64, count=n)
+            polygon.resize(n)
+            buf = polygon.data()
+            buf.setsize(n * 2 * 8)
+            coords = np.frombuffer(buf, dtype=np.float64).reshape(n, 2)
+            coords[:, 0] = plot_x + np.linspace(0.0, plot_w, n)
+            coords[:, 1] = plot_y + plot_h - (np.clip(values, 1.0, 5.0) - 1.0) * (plot_h / 4)
+        else:
+            for i, item in enumerate(self._data):
+                x = plot_x + (i / max(n - 1, 1)) * plot_w if n > 1 else plot_x + plot_w / 2
+                val = max(1.0, min(5.0, item["value"]))
+                y = plot_y + plot_h - ((val - 1) / 4) * plot_h
+                polygon.append(QPointF(x, y))
+
+        # Filled area under curve
+        if n >= 2:
+            bottom = plot_y + plot_h
+            area = QPolygonF(polygon)
+            area.prepend(QPointF(polygon.first().x(), bottom))
+            area.append(QPointF(polygon.last().x(), bottom))
+            fill_path = QPainterPath()
+            fill_path.addPolygon(area)
+            fill_path.closeSubpath()
+            self._fill_path = fill_path
+
+            gradient = QLinearGradient(0, plot_y, 0, plot_y + plot_h)
+            gradient.setColorAt(0, _FILL_TOP)
+            gradient.setColorAt(1, _FILL_BOTTOM)
+            self._gradient = gradient
+
+        self._label_y = plot_y + plot_h + 4
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._description_stale:
+            self._update_accessible_description()
+
     def _update_accessible_description(self):
+        self._description_stale = False
         if not self._data:
             self.setAccessibleDescription("No data available.")
             return
@@ -40,100 +159,65 @@ class LineChart(QWidget):
         desc = f"Effectiveness trend with {len(self._data)} data points. Average: {avg:.1f}/5. Recent: " + "; ".join(parts)
         self.setAccessibleDescription(desc)
 
+    def focusInEvent(self, event):
+        update_focus_ring(self)
+
+    def focusOutEvent(self, event):
+        update_focus_ring(self)
+
     def paintEvent(self, event):
-        if not self._data:
+        if self._polyline.isEmpty():
             return
-        c = get_colors()
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.drawPixmap(0, 0, self._pixmap_cache.pixmap(self, self._paint_chart))
 
-        w = self.width()
-        h = self.height()
-        plot_x = self.PAD_LEFT
-        plot_y = self.PAD_TOP
-        plot_w = w - self.PAD_LEFT - self.PAD_RIGHT
-        plot_h = h - self.PAD_TOP - self.PAD_BOTTOM
+        # Focus indicator
+        if self.hasFocus():
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(chart_pens()["focus"])
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawRoundedRect(
+                QRectF(1, 1, self.width() - 2, self.height() - 2), 4, 4)
 
-        if plot_w < 10 or plot_h < 10:
-            painter.end()
-            return
+        painter.end()
+
+    def _paint_chart(self, painter: QPainter):
+        """Draw the grid, line and labels into the chart's cached pixmap."""
+        pens = chart_pens()
+        plot_x = self.PAD_LEFT
+        plot_w = self.width() - self.PAD_LEFT - self.PAD_RIGHT
 
-        grid_pen = QPen(QColor(c["dark_border"]), 1, Qt.PenStyle.DotLine)
-        label_font = QFont()
-        label_font.setPixelSize(10)
-        painter.setFont(label_font)
+        painter.setFont(self._label_font)
 
         # Y-axis grid lines and labels (1 through 5)
-        for val in range(1, 6):
-            y = plot_y + plot_h - ((val - 1) / 4) * plot_h
-            painter.setPen(grid_pen)
+        for val, y in enumerate(self._grid_ys, start=1):
+            painter.setPen(pens["grid"])
             painter.drawLine(QPointF(plot_x, y), QPointF(plot_x + plot_w, y))
-            painter.setPen(QPen(QColor(c["text_muted"])))
-            painter.drawText(QRectF(0, y - 8, self.PAD_LEFT - 4, 16),
-                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
-                             str(val))
+            painter.setPen(pens["muted"])
+            painter.drawStaticText(QPointF(0, y - self._y_label_offset),
+                                   self._y_labels[val - 1])
 
-        # Map data to screen points
-        n = len(self._data)
-        points: list[QPointF] = []
-        for i, item in enumerate(self._data):
-            x = plot_x + (i / max(n - 1, 1)) * plot_w if n > 1 else plot_x + plot_w / 2
-            val = max(1.0, min(5.0, item["value"]))
-            y = plot_y + plot_h - ((val - 1) / 4) * plot_h
-            points.append(QPointF(x, y))
-
-        line_color = QColor(CHART_PALETTE[0])
+        polygon = self._polyline
 
         # Filled area under curve
-        if len(points) >= 2:
-            fill_path = QPainterPath()
-            fill_path.moveTo(QPointF(points[0].x(), plot_y + plot_h))
-            for p in points:
-                fill_path.lineTo(p)
-            fill_path.lineTo(QPointF(points[-1].x(), plot_y + plot_h))
-            fill_path.closeSubpath()
-
-            gradient = QLinearGradient(0, plot_y, 0, plot_y + plot_h)
-            fill = QColor(line_color)
-            fill.setAlpha(60)
-            gradient.setColorAt(0, fill)
-            fill_bottom = QColor(line_color)
-            fill_bottom.setAlpha(10)
-            gradient.setColorAt(1, fill_bottom)
-
+        if self._fill_path is not None:
             painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(gradient)
-            painter.drawPath(fill_path)
+            painter.setBrush(self._gradient)
+            painter.drawPath(self._fill_path)
 
         # Line
-        line_pen = QPen(line_color, 2)
-        painter.setPen(line_pen)
-        for i in range(len(points) - 1):
-            painter.drawLine(points[i], points[i + 1])
+        painter.setPen(_LINE_PEN)
+        painter.drawPolyline(polygon)
 
         # Dots
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(line_color)
-        for p in points:
-            painter.drawEllipse(p, 4, 4)
+        painter.setBrush(CHART_PALETTE_QCOLORS[0])
+        for i in range(polygon.count()):
+            painter.drawEllipse(polygon.at(i), 4, 4)
 
         # Date labels along x-axis
-        painter.setPen(QPen(QColor(c["text_muted"])))
-        painter.setFont(label_font)
-        # Show at most 6 labels to avoid overlap
-        step = max(1, n // 6)
-        for i in range(0, n, step):
-            x = points[i].x()
-            rect = QRectF(x - 30, plot_y + plot_h + 4, 60, 20)
-            painter.drawText(rect,
-                             Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop,
-                             self._data[i].get("date", ""))
-
-        # Focus indicator
-        if self.hasFocus():
-            focus_pen = QPen(QColor(c["primary"]), 2, Qt.PenStyle.DashLine)
-            painter.setPen(focus_pen)
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.drawRoundedRect(QRectF(1, 1, w - 2, h - 2), 4, 4)
-
-        painter.end()
+        painter.setPen(pens["muted"])
+        label_y = self._label_y
+        for i in self._label_indices:
+            painter.drawStaticText(QPointF(polygon.at(i).x() - 30, label_y),
+                                   self._date_labels[i])
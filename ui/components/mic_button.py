@@ -5,8 +5,9 @@ from PyQt6.QtCore import Qt, QTimer, QRectF
 from PyQt6.QtGui import QPainter, QPen, QColor
 
 from config.settings import get_colors
-from stt.engine import is_available, STTEngine
+from stt.engine import is_available, get_engine
 from stt.stt_settings_store import load_stt_settings
+from stt.workers import AudioRecordWorker, TranscribeWorker
 
 
 class MicButton(QPushButton):
@@ -183,7 +184,7 @@ class MicButton(QPushButton):
 
         # Check if model is cached; if not, show download dialog
         settings = load_stt_settings()
-        engine = STTEngine()
+        engine = get_engine()
         if not engine.is_model_cached(settings["model_size"]):
             from ui.components.model_download_dialog import ModelDownloadDialog
             dlg = ModelDownloadDialog(self.window())
@@ -200,7 +201,6 @@ class MicButton(QPushButton):
                 )
                 return
 
-        from stt.workers import AudioRecordWorker
         self._state = "recording"
         self._apply_recording_style()
         self._pulse_timer.start()
@@ -224,7 +224,6 @@ class MicButton(QPushButton):
         self.setAccessibleName("Transcribing speech...")
         self.setEnabled(False)
 
-        from stt.workers import TranscribeWorker
         self._transcribe_worker = TranscribeWorker(audio_array, self)
         self._transcribe_worker.transcription_ready.connect(self._on_text_ready)
         self._transcribe_worker.error_signal.connect(self._on_transcribe_error)
@@ -241,6 +240,9 @@ class MicButton(QPushButton):
         self._append_text(text)
 
     def _on_transcribe_done(self):
+        if self._transcribe_worker is not None:
+            self._transcribe_worker.deleteLater()
+            self._transcribe_worker = None
         self._state = "idle"
         self._apply_idle_style()
         self.setEnabled(True)
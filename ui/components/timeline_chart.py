@@ -2,13 +2,17 @@
 
 from PyQt6.QtWidgets import QWidget
 from PyQt6.QtCore import Qt, QPointF, QRectF
-from PyQt6.QtGui import QPainter, QColor, QFont, QPen
+from PyQt6.QtGui import QPainter, QFont
 
-from config.settings import get_colors
-from ui.components.chart_utils import CHART_PALETTE
+from ui.components.chart_utils import (
+    CHART_PALETTE_QCOLORS, ChartPixmapCache, chart_pens,
+)
 
 MAX_ENTRIES = 15
 
+_ALIGN_HCENTER_BOTTOM = Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignBottom
+_ALIGN_HCENTER_TOP = Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop
+
 
 class TimelineChart(QWidget):
     """Horizontal timeline — colored dots on a line, labels above, dates below."""
@@ -20,6 +24,8 @@ class TimelineChart(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._data: list[dict] = []
+        self._description_stale = False
+        self._pixmap_cache = ChartPixmapCache()
         self.setFixedHeight(self.FIXED_HEIGHT)
         self.setAccessibleName("Activity timeline")
         self.setFocusPolicy(Qt.FocusPolicy.TabFocus)
@@ -29,13 +35,26 @@ class TimelineChart(QWidget):
 
         Most recent entries last.  Capped to MAX_ENTRIES.
         """
-        self._data = (data or [])[-MAX_ENTRIES:]
+        data = (data or [])[-MAX_ENTRIES:]
+        # Refreshes often pass the same entries again; keep the rendered chart
+        if data != self._data:
+            self._pixmap_cache.invalidate()
+        self._data = data
         total_w = max(self.ENTRY_WIDTH * len(self._data) + 40, 200)
         self.setMinimumWidth(total_w)
-        self._update_accessible_description()
+        # Hidden charts are not read out; describe them when next shown
+        self._description_stale = True
+        if self.isVisible():
+            self._update_accessible_description()
         self.update()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._description_stale:
+            self._update_accessible_description()
+
     def _update_accessible_description(self):
+        self._description_stale = False
         if not self._data:
             self.setAccessibleDescription("No timeline entries.")
             return
@@ -44,11 +63,27 @@ class TimelineChart(QWidget):
         self.setAccessibleDescription(desc)
 
     def paintEvent(self, event):
-        if not self._data:
+        if not self._data or self.width() <= 0:
             return
-        c = get_colors()
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.drawPixmap(0, 0, self._pixmap_cache.pixmap(self, self._paint_chart))
+
+        # Focus indicator
+        if self.hasFocus():
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(chart_pens()["focus"])
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawRoundedRect(
+                QRectF(1, 1, self.width() - 2, self.height() - 2), 4, 4
+            )
+
+        painter.end()
+
+    def _paint_chart(self, painter: QPainter):
+        """Draw the line, dots and labels into the chart's cached pixmap."""
+        pens = chart_pens()
+        palette = CHART_PALETTE_QCOLORS
+        n_colors = len(palette)
 
         n = len(self._data)
         h = self.height()
@@ -62,10 +97,10 @@ class TimelineChart(QWidget):
         xs = [pad_l + i * spacing for i in range(n)]
 
         # Horizontal line
-        line_pen = QPen(QColor(c["dark_border"]), 2)
-        painter.setPen(line_pen)
+        painter.setPen(pens["axis"])
         painter.drawLine(QPointF(xs[0], mid_y), QPointF(xs[-1], mid_y))
 
+        no_pen = Qt.PenStyle.NoPen
         label_font = QFont()
         label_font.setPixelSize(11)
         date_font = QFont()
@@ -73,30 +108,30 @@ class TimelineChart(QWidget):
 
         for i, item in enumerate(self._data):
             cx = xs[i]
-            color = QColor(CHART_PALETTE[i % len(CHART_PALETTE)])
+            color = palette[i % n_colors]
 
             # Dot
-            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setPen(no_pen)
             painter.setBrush(color)
             painter.drawEllipse(QPointF(cx, mid_y), self.DOT_RADIUS, self.DOT_RADIUS)
 
             # Label above
-            painter.setPen(QPen(QColor(c["text"])))
+            painter.setPen(pens["text"])
             painter.setFont(label_font)
             label_rect = QRectF(cx - 45, mid_y - 50, 90, 36)
             painter.drawText(
                 label_rect,
-                Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignBottom,
+                _ALIGN_HCENTER_BOTTOM,
                 item.get("label", "")[:18],
             )
 
             # Sublabel (date) below
-            painter.setPen(QPen(QColor(c["text_muted"])))
+            painter.setPen(pens["muted"])
             painter.setFont(date_font)
             date_rect = QRectF(cx - 45, mid_y + 12, 90, 30)
             painter.drawText(
                 date_rect,
-                Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop,
+                _ALIGN_HCENTER_TOP,
                 item.get("date", ""),
             )
             # Extra sublabel line
@@ -105,17 +140,6 @@ class TimelineChart(QWidget):
                 sub_rect = QRectF(cx - 45, mid_y + 26, 90, 30)
                 painter.drawText(
                     sub_rect,
-                    Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop,
+                    _ALIGN_HCENTER_TOP,
                     sublabel[:18],
                 )
-
-        # Focus indicator
-        if self.hasFocus():
-            focus_pen = QPen(QColor(c["primary"]), 2, Qt.PenStyle.DashLine)
-            painter.setPen(focus_pen)
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.drawRoundedRect(
-                QRectF(1, 1, self.width() - 2, h - 2), 4, 4
-            )
-
-        painter.end()
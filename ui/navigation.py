@@ -9,7 +9,7 @@ from models.database import DatabaseManager
 from models.auth import AuthManager
 from ai.backend_manager import BackendManager
 from ui.accessibility import AccessibilityManager
-from ui.accessibility_prefs import save_prefs
+from ui.accessibility_prefs import save_prefs_later
 from ui.theme_engine import get_main_stylesheet, get_role_stylesheet
 from ui.cursor_trail import CursorTrailOverlay
 from ui.reading_ruler import ReadingRulerOverlay
@@ -59,7 +59,12 @@ class MainWindow(QMainWindow):
 
         # Apply theme
         self._apply_theme()
+        # The stylesheet reads nearly every setting; palette, cursor and
+        # reading ruler only refresh for the settings they depend on.
         self.a11y.settings_changed.connect(self._on_a11y_changed)
+        self.a11y.colors_changed.connect(self._apply_palette)
+        self.a11y.cursor_changed.connect(self._apply_cursor)
+        self.a11y.focus_changed.connect(self._apply_reading_ruler)
 
         # Global shortcuts
         QShortcut(QKeySequence("Ctrl+/"), self).activated.connect(self._show_shortcuts_dialog)
@@ -92,6 +97,11 @@ class MainWindow(QMainWindow):
     # -- theme / a11y --
 
     def _apply_theme(self):
+        self._apply_stylesheet()
+        self._apply_cursor()
+        self._apply_reading_ruler()
+
+    def _apply_stylesheet(self):
         colors = self.a11y.get_effective_colors()
         fonts = self.a11y.get_font_sizes()
         qss = get_main_stylesheet(
@@ -109,7 +119,7 @@ class MainWindow(QMainWindow):
             qss += get_role_stylesheet(self.a11y.role_accent)
         self.setStyleSheet(qss)
 
-        # Custom cursor
+    def _apply_cursor(self):
         cursor = self.a11y.get_cursor()
         if cursor:
             QApplication.setOverrideCursor(cursor)
@@ -122,7 +132,7 @@ class MainWindow(QMainWindow):
         elif self._cursor_trail:
             self._cursor_trail.stop()
 
-        # Reading ruler
+    def _apply_reading_ruler(self):
         if self.a11y.reading_ruler:
             self._start_reading_ruler()
         elif self._reading_ruler:
@@ -146,9 +156,10 @@ class MainWindow(QMainWindow):
         self._reading_ruler.start()
 
     def _on_a11y_changed(self):
-        self._apply_theme()
-        save_prefs(self.a11y.to_dict())
-        # Re-apply palette
+        self._apply_stylesheet()
+        save_prefs_later(self.a11y.to_dict())
+
+    def _apply_palette(self):
         from main import setup_palette
         setup_palette(QApplication.instance())
 
@@ -309,8 +309,8 @@ class LoginScreen(QWidget):
 
         self._build_ui()
 
-        # Listen for accessibility changes to re-apply styles
-        self.a11y.settings_changed.connect(self._on_a11y_changed)
+        # Styles here only use theme colors, so re-apply on color changes
+        self.a11y.colors_changed.connect(self._on_a11y_changed)
 
     # ── build ──
 
@@ -632,7 +632,7 @@ class LoginScreen(QWidget):
         self._switch_tab(self._current_tab)
 
     def _on_a11y_changed(self):
-        """Re-apply all styles when accessibility settings change."""
+        """Re-apply all styles when the accessibility colors change."""
         self._apply_styles()
 
     # ── tabs ──
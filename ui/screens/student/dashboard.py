@@ -155,8 +155,7 @@ class StudentDashboard(QWidget):
 
     def _open_settings(self):
         from ui.components.accessibility_panel import AccessibilityPanel
-        dlg = AccessibilityPanel(self)
-        dlg.exec()
+        AccessibilityPanel.open_for(self)
 
     def _open_tutorial(self):
         from ui.components.tutorial_dialog import TutorialDialog
@@ -181,6 +181,92 @@ def get_main_stylesheet(colors: dict = None, fonts: dict = None,
         color: {c['text']};
     }}
 
+    /* Shared components, matched by the object names they set */
+    QWidget#chartCard {{
+        background: {c['dark_card']};
+        border: 1px solid {c['dark_border']};
+        border-radius: 12px;
+    }}
+    QWidget#chartCard QWidget {{
+        background: transparent;
+        border: none;
+    }}
+    QLabel#chartCardTitle {{
+        font-size: 14px;
+        font-weight: bold;
+        color: {c['text']};
+    }}
+
+    QLabel#emptyStateIcon {{
+        font-size: 48px;
+        color: {c['text_muted']};
+    }}
+    QLabel#emptyStateMessage {{
+        font-size: 16px;
+        color: {c['text_muted']};
+    }}
+    QPushButton#emptyStateAction {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 {c['primary']}, stop:1 {c['tertiary']});
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 8px 24px;
+        font-weight: bold;
+    }}
+
+    QPushButton#helpButton {{
+        background-color: {c['dark_input']};
+        color: {c['text']};
+        border: 1px solid rgba(255,255,255,0.15);
+        border-radius: 22px;
+        font-size: 18px;
+        font-weight: bold;
+    }}
+    QPushButton#helpButton:hover {{
+        background-color: {c['primary']};
+    }}
+    QDialog#helpDialog {{
+        background-color: {c['dark_bg']};
+    }}
+    QLabel#helpTitle {{
+        font-size: 20px;
+        font-weight: bold;
+        color: {c['text']};
+    }}
+    QWidget#helpCard {{
+        background: {c['dark_card']};
+        border: 1px solid {c['dark_border']};
+        border-radius: 12px;
+    }}
+    QLabel#helpBody {{
+        background: {c['dark_card']};
+        font-size: 13px;
+        color: {c['text']};
+        line-height: 1.5;
+        border: none;
+    }}
+    QPushButton#helpGuideAction {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 {c['primary']}, stop:1 {c['tertiary']});
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 8px 24px;
+        font-weight: bold;
+        font-size: 13px;
+    }}
+    QPushButton#helpClose {{
+        background: {c['dark_input']};
+        color: {c['text']};
+        border: 1px solid {c['dark_border']};
+        border-radius: 8px;
+        font-size: 13px;
+    }}
+    QPushButton#helpClose:hover {{
+        background: {c['dark_hover']};
+    }}
+
     {focus_extra}
 
     {"" if not reduced_motion else '''